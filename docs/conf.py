@@ -39,6 +39,10 @@ extensions = [
 # Add any paths that contain templates here, relative to this directory.
 templates_path = []
 
+# Labels are generated for every section title, and titles repeated across
+# pages produce a duplicate label warning for each occurence
+suppress_warnings = ['autosectionlabel.*']
+
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
@@ -61,6 +65,34 @@ sass_src_dir = "styles"
 sass_out_dir = "_static/css"
 sass_targets = {"main.scss": "main.css"}
 
+
+def _sass_outdated():
+    """
+    Check if a compiled stylesheet is missing or older than any of the sass
+    sources, in which case the sass extension needs to run
+    """
+    confdir = os.path.dirname(os.path.abspath(__file__))
+    sources_dir = os.path.join(confdir, sass_src_dir)
+
+    sources = [
+        os.path.join(root, name)
+        for root, _, names in os.walk(sources_dir) for name in names
+        if name.endswith(('.scss', '.sass'))
+    ]
+    latest_source = max(map(os.path.getmtime, sources), default=0)
+
+    for target in sass_targets.values():
+        output = os.path.join(confdir, sass_out_dir, target)
+        if not os.path.exists(output) or os.path.getmtime(
+                output) < latest_source:
+            return True
+    return False
+
+
+# Skip the stylesheet compilation when the outputs are up to date
+if not _sass_outdated():
+    extensions.remove('sphinxcontrib.sass')
+
 # -- HTML theme options ------------------------------------------------------
 
 # Make fonts bigger for clarity
@@ -1,6 +1,7 @@
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 try:
     from e4s_cl.version import __version__
 except ModuleNotFoundError:
@@ -30,9 +31,8 @@ A tuple of at least (MAJOR, MINOR) directly comparible to :any:`sys.version_info
 PYTHON_VERSION = sys.version_info[0:3]
 """list: Version of the running python interpreter"""
 
-if sys.version_info[0] < MIN_PYTHON_VERSION[0] or sys.version_info[
-        1] < MIN_PYTHON_VERSION[1]:
-    VERSION = '.'.join([str(x) for x in sys.version_info[0:3]])
+if PYTHON_VERSION < MIN_PYTHON_VERSION:
+    VERSION = '.'.join([str(x) for x in PYTHON_VERSION])
     EXPECTED = '.'.join([str(x) for x in MIN_PYTHON_VERSION])
     sys.stderr.write(f"""{sys.executable}
 {sys.version}
@@ -46,15 +46,18 @@ E4S_CL_TEST = bool(os.environ.get('__E4S_CL_TEST__', False))
 
 # Use a file to brand installation directories
 _HOME_MARKER = '.e4s-cl-home'
-__install_home = None
 
-# Look at all the parent of the package to look for the marker
-for parent in Path(__file__).resolve().parents:
-    if Path(parent, _HOME_MARKER).exists():
-        __install_home = parent
+
+def _install_home() -> Optional[Path]:
+    """Return the closest parent of the package containing the installation marker"""
+    for parent in Path(__file__).resolve().parents:
+        if Path(parent, _HOME_MARKER).exists():
+            return parent
+    return None
+
 
 E4S_CL_HOME = Path(
-    os.environ.get('__E4S_CL_HOME__', __install_home
+    os.environ.get('__E4S_CL_HOME__', _install_home()
                    or Path(__file__).parents[1])).resolve().as_posix()
 """str: Absolute path to the top-level E4S Container Launcher directory.
 
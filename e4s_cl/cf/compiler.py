@@ -1,45 +1,20 @@
 """
 Determine what compiler vendor was used to compile a given binary, by checking the .comments ELF section
 """
-from typing import Iterable
+import os
+import re
+import mmap
+from functools import lru_cache
+from typing import Iterable, Set
 from enum import IntEnum
 from pathlib import Path
 from elftools.elf.elffile import ELFFile
 from elftools.common.exceptions import ELFError
 from e4s_cl.logger import get_logger
-from e4s_cl.util import which
 
 LOGGER = get_logger(__name__)
 
 
-def _gnu_check(string: str) -> bool:
-    return 'GCC' in string
-
-
-def _llvm_check(string: str) -> bool:
-    return 'clang' in string
-
-
-def _intel_check(_: str) -> bool:
-    return False
-
-
-def _amd_check(string: str) -> bool:
-    return 'AMD' in string
-
-
-def _pgi_check(_: str) -> bool:
-    return False
-
-
-def _armclang_check(_: str) -> bool:
-    return False
-
-
-def _fujitsu_check(_: str) -> bool:
-    return False
-
-
 class CompilerVendor(IntEnum):
     """Enum with values describing compiler vendors"""
     GNU = 0
@@ -51,16 +26,6 @@ class CompilerVendor(IntEnum):
     FUJITSU = 6
 
 
-CHECKS = {
-    CompilerVendor.GNU: _gnu_check,
-    CompilerVendor.LLVM: _llvm_check,
-    CompilerVendor.INTEL: _intel_check,
-    CompilerVendor.AMD: _amd_check,
-    CompilerVendor.PGI: _pgi_check,
-    CompilerVendor.ARMCLANG: _armclang_check,
-    CompilerVendor.FUJITSU: _fujitsu_check
-}
-
 VENDOR_BINARIES = {
     CompilerVendor.GNU: ('gcc', 'g++', 'gfortran'),
     CompilerVendor.INTEL: ('icc', 'icpc', 'ifort'),
@@ -71,53 +36,116 @@ VENDOR_BINARIES = {
     CompilerVendor.FUJITSU: ('fcc', 'FCC', 'frt'),
 }
 
+# Binaries required by every vendor, and all binaries to look for, as sets.
+# VENDOR_BINARIES keeps tuples as the order of the binaries is meaningful
+_VENDOR_REQUIREMENTS = {
+    vendor: frozenset(binaries)
+    for vendor, binaries in VENDOR_BINARIES.items()
+}
+_COMPILER_BINARIES = frozenset().union(*_VENDOR_REQUIREMENTS.values())
+
 # ROCm-compiled binaries contained 'AMD', 'clang' and 'GCC'
 # Establishing an order for the checks is a simple way
 # of ensuring the right value is returned
 PRECENDENCE = [CompilerVendor.AMD, CompilerVendor.LLVM, CompilerVendor.GNU]
 
+# Markers left by the vendors in the .comment section
+_MARKERS = {
+    CompilerVendor.AMD: b'AMD',
+    CompilerVendor.LLVM: b'clang',
+    CompilerVendor.GNU: b'GCC',
+}
 
-def _get_comment(elf_file: Path) -> str:
+# Find all the vendor markers of a comment in a single pass
+_VENDOR_MARKERS = re.compile(b'|'.join(_MARKERS[vendor]
+                                       for vendor in PRECENDENCE))
+
+
+@lru_cache(maxsize=4096)
+def _read_comment(elf_file: str, _mtime: int, _size: int) -> bytes:
+    """
+    Read the .comment section of an ELF file. The modification time and size
+    of the file are part of the cache key to invalidate outdated entries.
+    """
+    try:
+        # Map the file in memory to have pyelftools' many small reads served
+        # from the page cache instead of individual system calls
+        with open(elf_file, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, prot=mmap.PROT_READ) as data:
+            section = ELFFile(data).get_section_by_name('.comment')
+            return section.data() if section else b''
+    except (OSError, ValueError, ELFError) as err:
+        LOGGER.debug("Error reading comments of file %s: %s", elf_file,
+                     str(err))
+        return b''
+
+
+def _get_comment_bytes(elf_file: Path) -> bytes:
     """
-    Returns the contents of the .comment sections of the ELF file passed as an argument
+    Returns the raw contents of the .comment section of the ELF file passed as an argument
     """
     try:
-        with open(elf_file, 'rb') as data:
-            elf = ELFFile(data)
-            comment_sections = filter(lambda x: x.name == '.comment',
-                                      elf.iter_sections())
-            return ' - '.join(
-                map(lambda x: x.data().decode(), comment_sections))
-    except (PermissionError, FileNotFoundError, IsADirectoryError,
-            ELFError) as err:
+        stat = os.stat(elf_file)
+    except (PermissionError, FileNotFoundError) as err:
         LOGGER.debug("Error reading comments of file %s: %s", str(elf_file),
                      str(err))
-        return ''
+        return b''
+
+    return _read_comment(str(elf_file), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_comment(elf_file: Path) -> str:
+    """
+    Returns the contents of the .comment section of the ELF file passed as an argument
+    """
+    return _get_comment_bytes(elf_file).decode(errors='replace')
 
 
 def compiler_vendor(elf_file: Path) -> int:
     """
     Returns a value from CompilerVendor according to the contents of the .comment section of a binary
     """
-    comment = _get_comment(elf_file)
+    # The markers are looked for in the raw section, without decoding it
+    found = set(_VENDOR_MARKERS.findall(_get_comment_bytes(elf_file)))
 
     for vendor in PRECENDENCE:
-        check = CHECKS.get(vendor)
-        if check and check(comment):
+        if _MARKERS[vendor] in found:
             return vendor
 
     # By default, return GNU
     return CompilerVendor.GNU
 
 
-def available_compilers() -> Iterable[int]:
-    """Return a list of compiler identifiers for compilers found on the system"""
+def _executables_in_path(names: Set[str]) -> Set[str]:
+    """
+    Return the subset of names that match an executable file in PATH. Every
+    directory is listed once, instead of probing it for every name.
+    """
+    found = set()
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        # Stop looking once every name has been found
+        if len(found) == len(names):
+            break
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if entry.name not in names or entry.name in found:
+                        continue
+                    if entry.is_file() and os.access(entry.path, os.X_OK):
+                        found.add(entry.name)
+        except OSError:
+            continue
+
+    return found
 
-    available = set()
-    for vendor, requirements in VENDOR_BINARIES.items():
-        # Check which found every requirement for the compiler
-        if len(set(filter(None, map(which,
-                                    requirements)))) == len(requirements):
-            available.add(vendor)
 
-    return available
+def available_compilers() -> Iterable[int]:
+    """Return a list of compiler identifiers for compilers found on the system"""
+    found = _executables_in_path(_COMPILER_BINARIES)
+
+    # Check every requirement for the compiler was found
+    return {
+        vendor
+        for vendor, requirements in _VENDOR_REQUIREMENTS.items()
+        if requirements <= found
+    }
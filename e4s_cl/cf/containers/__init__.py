@@ -12,17 +12,19 @@ that posesses the following attributes:
         an image
     - CLASS: the class to use. The class' `run` method will be used when launching
         the container: refer to its docstring for details
+then register it in BACKENDS, and in MIMES if it uses files. The submodule is
+only imported when the backend is first used.
 """
 
+import os
 import re
 import sys
 import json
-from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
-from tempfile import TemporaryFile, NamedTemporaryFile
 from pathlib import Path
-from typing import Union, List, Tuple, Iterable, Optional
-from sotools.dl_cache import cache_libraries, get_generator
+from typing import Union, List, NamedTuple, Set, Tuple, Iterable, Optional
+from sotools.dl_cache import get_generator
 from e4s_cl.logger import get_logger, debug_mode
 from e4s_cl import (
     CONTAINER_BINARY_DIR,
@@ -36,25 +38,49 @@ from e4s_cl.variables import ParentStatus
 from e4s_cl.util import (
     get_env,
     json_loads,
-    path_contains,
     run_e4scl_subprocess,
-    walk_packages,
     which,
 )
 from e4s_cl.cf.version import Version
+from e4s_cl.cf.libraries import cache_libraries_data
 from e4s_cl.error import ConfigurationError
 
 LOGGER = get_logger(__name__)
 
-# List of available modules, accessible by their "executable" or cli tool names
-BACKENDS = {'barebones': 'e4s_cl.cf.containers.barebones'}
+# Available backends, accessible by their "executable" or cli tool names
+# dict of name: (module name, class name)
+BACKENDS = {
+    'apptainer': (f"{__name__}.apptainer", 'ApptainerContainer'),
+    'barebones': (f"{__name__}.barebones", 'BarebonesContainer'),
+    'docker': (f"{__name__}.docker", 'DockerContainer'),
+    'containerless': (f"{__name__}.host", 'Containerless'),
+    'podman': (f"{__name__}.podman", 'PodmanContainer'),
+    'shifter': (f"{__name__}.shifter", 'ShifterContainer'),
+    'singularity': (f"{__name__}.singularity", 'SingularityContainer'),
+    'dummy': (f"{__name__}.dummy", 'DummyContainer'),
+}
+
+# Backends used for debugging, hidden from help and completion
+_DEBUG_BACKENDS = {'dummy'}
 
 # List of available, non-debug backends, for help and completion
-EXPOSED_BACKENDS = []
+EXPOSED_BACKENDS = [name for name in BACKENDS if name not in _DEBUG_BACKENDS]
 
 # Used to identify backends by the image's suffix
-# list of tuples containing (suffix, backend_name)
-MIMES = []
+# dict of suffix: list of backend names
+MIMES = {
+    '.simg': ['apptainer', 'singularity'],
+    '.sif': ['apptainer', 'singularity'],
+}
+
+# Paths used in the containers, created once as they never change
+_SCRIPT_PATH = Path(CONTAINER_SCRIPT)
+_IMPORT_DIR = Path(CONTAINER_DIR)
+_IMPORT_LIBRARY_DIR = Path(CONTAINER_LIBRARY_DIR)
+_IMPORT_BINARY_DIR = Path(CONTAINER_BINARY_DIR)
+
+# Results of the analysis of all images during this session
+_ANALYSES = {}
 
 
 # pylint: disable=too-few-public-methods
@@ -66,8 +92,9 @@ class FileOptions:
     READ_WRITE = 1
 
 
-@dataclass(frozen=True)  # Frozen to take advantage of the hashing capacities
-class BoundFile:
+# A named tuple is immutable, hashable, and has no per-instance __dict__,
+# which matters as thousands of these get created when binding libraries
+class BoundFile(NamedTuple):
     """Element of the bound file dictionnary"""
     origin: Path
     destination: Path
@@ -155,77 +182,199 @@ def _contains(container: BoundFile, containee: BoundFile) -> bool:
         - Two different files are bound to a single destination
         """
 
+    # Check for arborescence delta matches, comparing the path components
+    # instead of using relative_to and catching its exceptions
+    origin, destination = container.origin.parts, container.destination.parts
+    containee_origin = containee.origin.parts
+    containee_destination = containee.destination.parts
+
+    if containee_origin[:len(origin)] == origin \
+            and containee_destination[:len(destination)] == destination \
+            and containee_origin[len(origin):] == \
+            containee_destination[len(destination):]:
+        return True
+
     # Check for an exact match between the container and containee
-    exact_match = False
     if containee.destination == container.destination:
-        exact_match = (
-            container.origin.resolve() == containee.origin.resolve())
-
-    # Check for arborescence delta matches
-    try:
-        arborescence = containee.origin.relative_to(
-            container.origin) == containee.destination.relative_to(
-                container.destination)
-    except ValueError:
-        arborescence = False
+        return _resolve(str(container.origin)) == _resolve(
+            str(containee.origin))
 
-    return exact_match or arborescence
+    return False
 
 
-def optimize_bind_addition(
-        new: BoundFile,
-        bound_files: Iterable[BoundFile]) -> Iterable[BoundFile]:
+class _BindTrie:
     """
-    Adds new to bound_files, if needed. Performs optimizations to prevent
-    double binds/superfluous binds, and returns the optimized bind set
+    Set of bound files, indexed by the components of their origin path and by
+    their destination. Finding the binds containing or contained by a given
+    bind walks the origin's components instead of comparing every bind.
     """
 
-    new_binds = set(bound_files)
+    class _Node:
+        """Node of the trie, holding the binds whose origin ends here"""
+        __slots__ = ('children', 'binds')
+
+        def __init__(self):
+            self.children = {}
+            self.binds = set()
+
+    def __init__(self, bound_files: Iterable[BoundFile] = ()):
+        self._root = self._Node()
+        self._destinations = {}
+        self._size = 0
+
+        for bind in bound_files:
+            self.add(bind)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            yield from node.binds
+            stack.extend(node.children.values())
+
+    def __contains__(self, bind):
+        node = self._find(bind.origin.parts)
+        return node is not None and bind in node.binds
+
+    def _find(self, parts: Tuple[str, ...]) -> Optional['_BindTrie._Node']:
+        node = self._root
+        for part in parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def add(self, bind: BoundFile) -> None:
+        node = self._root
+        for part in bind.origin.parts:
+            node = node.children.setdefault(part, self._Node())
+
+        if bind not in node.binds:
+            node.binds.add(bind)
+            self._destinations.setdefault(bind.destination, set()).add(bind)
+            self._size += 1
+
+    def discard(self, bind: BoundFile) -> None:
+        node = self._find(bind.origin.parts)
+        if node is None or bind not in node.binds:
+            return
+
+        node.binds.discard(bind)
+        self._destinations[bind.destination].discard(bind)
+        self._size -= 1
+
+    def _same_target(self, new: BoundFile) -> Set[BoundFile]:
+        """Binds to the same destination, from the same resolved origin"""
+        resolved = _resolve(str(new.origin))
+        return {
+            bind
+            for bind in self._destinations.get(new.destination, ())
+            if _resolve(str(bind.origin)) == resolved
+        }
+
+    def containing(self, new: BoundFile) -> Set[BoundFile]:
+        """Return the binds b for which _contains(b, new) is True"""
+        origin, destination = new.origin.parts, new.destination.parts
+        matches = self._same_target(new)
+
+        # Walk down the ancestors of new's origin
+        node = self._root
+        for depth in range(len(origin) + 1):
+            for bind in node.binds:
+                prefix = bind.destination.parts
+                if destination[:len(prefix)] == prefix \
+                        and origin[depth:] == destination[len(prefix):]:
+                    matches.add(bind)
+
+            if depth == len(origin):
+                break
+            node = node.children.get(origin[depth])
+            if node is None:
+                break
+
+        return matches
+
+    def contained(self, new: BoundFile) -> Set[BoundFile]:
+        """Return the binds b for which _contains(new, b) is True"""
+        origin, destination = new.origin.parts, new.destination.parts
+        matches = self._same_target(new)
+
+        # Walk through the descendants of new's origin
+        node = self._find(origin)
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            for bind in node.binds:
+                suffix = bind.origin.parts[len(origin):]
+                parts = bind.destination.parts
+                if parts[:len(destination)] == destination \
+                        and suffix == parts[len(destination):]:
+                    matches.add(bind)
+            stack.extend(node.children.values())
+
+        return matches
+
+
+def _optimize_bind_addition(new: BoundFile, bound_files: _BindTrie) -> None:
+    """
+    Adds new to bound_files in place, if needed. Performs optimizations to
+    prevent double binds/superfluous binds
+    """
 
     # Check if the file to be bound is contained in already bound files/folders
     # If it is, check that the containing files/folders' permissions align with
     # the new file and update them if need be
-    target_contained = set(
-        filter(lambda bind: _contains(bind, new), bound_files))
+    target_contained = bound_files.containing(new)
 
     if target_contained:
-        # Compute the max permission required by the files containing new. If
-        # they allow a lower level of permissions, re-bind them with the
-        # necessary permissions
-        target_contained_permissions = max(
-            map(lambda x: x.option, target_contained))
-
-        if target_contained_permissions < new.option:
-            # Re create all the binds
-            new_contained = set(
-                map(lambda x: BoundFile(x.origin, x.destination, new.option),
-                    target_contained))
-
-            # Remove the old binds
-            new_binds = new_binds - target_contained
-
-            # Add the ones created above
-            new_binds = new_binds | new_contained
+        # If the files containing new all allow a lower level of permissions
+        # than required, re-bind them with the necessary permissions. This
+        # stops at the first bind allowing enough permissions
+        if all(bind.option < new.option for bind in target_contained):
+            for bind in target_contained:
+                bound_files.discard(bind)
+                bound_files.add(
+                    BoundFile(bind.origin, bind.destination, new.option))
 
-        return new_binds
+        return
 
     # Check if the file to be bound is containing already bound files/folders
     # If it is, check that the new file's permissions align with the contained files/folders
     # and then unbind them with a new permission level if need be
-    target_containing = set(filter(lambda b: _contains(new, b), bound_files))
+    option = new.option
+    for bind in bound_files.contained(new):
+        # Unbind the files contained by new, while computing the permissions
+        # they require to update new's permissions accordingly
+        option = max(option, bind.option)
+        bound_files.discard(bind)
 
-    if target_containing:
-        # Check the permissions requires by the files contained by new, and
-        # update new's permissions accordingly
-        target_containing_permissions = max(
-            map(lambda x: x.option, target_containing))
+    if option > new.option:
+        new = BoundFile(new.origin, new.destination, option)
+
+    bound_files.add(new)
+
+
+def optimize_bind_addition(new: BoundFile,
+                           bound_files: Iterable[BoundFile]) -> Set[BoundFile]:
+    """
+    Adds new to bound_files, if needed. Performs optimizations to prevent
+    double binds/superfluous binds, and returns the optimized bind set
+    """
+    index = _BindTrie(bound_files)
+    _optimize_bind_addition(new, index)
+    return set(index)
 
-        if target_containing_permissions > new.option:
-            new = BoundFile(new.origin, new.destination,
-                            target_containing_permissions)
 
-    new_binds.add(new)
-    return new_binds - target_containing
+@lru_cache(maxsize=4096)
+def _resolve(path: str) -> str:
+    """
+    Cached os.path.realpath(). Every call otherwise stats each component of
+    the path, and the same library directories get resolved over and over
+    """
+    return os.path.realpath(path)
 
 
 def _unrelative(string: str) -> Iterable[Path]:
@@ -233,26 +382,86 @@ def _unrelative(string: str) -> Iterable[Path]:
     Returns a list of all the directories referenced by a relative path
     """
 
-    path = Path(string)
-    visited = {path, path.resolve()}
-    deps = set()
+    # Work on strings, Path objects are only created for the results
+    string = os.fspath(string)
+    resolved = _resolve(string)
 
-    for i, part in enumerate(path.parts):
-        if part == '..':
-            visited.add(Path(*path.parts[:i]).resolve())
+    # Most paths do not contain any symlink nor '..' component
+    if resolved == string:
+        return {Path(string)}
 
-    for element in visited:
-        contained = False
-        for path in visited:
-            if path != element and path_contains(path, element):
-                contained = True
+    path = Path(string)
+    visited = {path, Path(resolved)}
+    deps = set()
 
-        if not contained:
+    parts = path.parts
+    if '..' in parts:
+        for i, part in enumerate(parts):
+            if part == '..':
+                prefix = os.path.join(*parts[:i]) if i else os.curdir
+                visited.add(Path(_resolve(prefix)))
+
+    # Sweep the paths from the shallowest to the deepest: a path is kept
+    # unless one of the paths already kept is a prefix of it
+    roots = []
+    for element in sorted(visited, key=lambda p: len(p.parts)):
+        candidate = element.parts
+        if not any(candidate[:len(root)] == root for root in roots):
+            roots.append(candidate)
             deps.add(element)
 
     return deps
 
 
+def _existing(paths: Iterable[Path]) -> Set[Path]:
+    """
+    Returns the paths that exist among the ones given. The existence of
+    siblings is checked by listing their directory once, instead of calling
+    stat on each of them.
+    """
+    siblings = {}
+    for path in paths:
+        siblings.setdefault(path.parent, []).append(path)
+
+    existing = set()
+    for parent, children in siblings.items():
+        entries = None
+        if len(children) > 1:
+            try:
+                with os.scandir(parent) as iterator:
+                    entries = {entry.name: entry for entry in iterator}
+            except OSError:
+                pass
+
+        for child in children:
+            entry = None if entries is None else entries.get(child.name)
+
+            # Links need to be followed to ensure their target exists, and
+            # special names are not listed
+            if entries is None or child.name in ('', '..') or (
+                    entry is not None and entry.is_symlink()):
+                found = child.exists()
+            else:
+                found = entry is not None
+
+            if found:
+                existing.add(child)
+
+    return existing
+
+
+def invalidate_analysis_cache(image: Optional[str] = None) -> None:
+    """
+    Forget the analyses of the given image, or of all images if None
+    """
+
+    def _outdated(key: str) -> bool:
+        return image is None or json.loads(key)[1] == str(image)
+
+    for key in [key for key in _ANALYSES if _outdated(key)]:
+        del _ANALYSES[key]
+
+
 class Container:
     """
     Abstract class that auto-completes depending on the container tech
@@ -264,13 +473,14 @@ class Container:
         Object level creation hijacking: depending on the executable
         argument, the appropriate subclass will be returned.
         """
-        module_name = BACKENDS.get(name)
-        if module_name:
-            module = sys.modules.get(module_name)
-        else:
+        if name not in BACKENDS:
             raise BackendUnsupported(name)
 
-        driver = object.__new__(module.CLASS)
+        backend = _load_backend(name)
+        if backend is None:
+            raise BackendNotAvailableError(name)
+
+        driver = object.__new__(backend)
 
         # If in debugging mode, print out the config before running
         if debug_mode():
@@ -291,11 +501,15 @@ class Container:
         self.name = name
 
         # User-set parameters
-        # Files to bind: set(BoundFile)
-        self._bound_files = set()
+        # Files to bind: set(BoundFile), indexed to speed up insertions
+        self._bound_files = _BindTrie()
+        # Checked bound files, computed on first access after a change
+        self._bound_cache = None
         self.env = {}  # Environment
-        self.ld_preload = []  # Files to put in LD_PRELOAD
-        self.ld_lib_path = []  # Directories to put in LD_LIBRARY_PATH
+        # Files to put in LD_PRELOAD and directories to put in LD_LIBRARY_PATH,
+        # as dicts with no values to keep the insertion order without duplicates
+        self.ld_preload = {}
+        self.ld_lib_path = {}
 
         self.libc_v = Version('0.0.0')
         self.cache = {}
@@ -305,19 +519,19 @@ class Container:
 
     @property
     def script(self):
-        return Path(CONTAINER_SCRIPT)
+        return _SCRIPT_PATH
 
     @property
     def import_dir(self):
-        return Path(CONTAINER_DIR)
+        return _IMPORT_DIR
 
     @property
     def import_library_dir(self):
-        return Path(CONTAINER_LIBRARY_DIR)
+        return _IMPORT_LIBRARY_DIR
 
     @property
     def import_binary_dir(self):
-        return Path(CONTAINER_BINARY_DIR)
+        return _IMPORT_BINARY_DIR
 
     def _executable(self) -> Optional[Path]:
         """
@@ -436,6 +650,16 @@ class Container:
 
         return []
 
+    def _analysis_key(self) -> str:
+        """
+        Returns the key identifying the analysis of the image with this
+        backend and its current options
+        """
+        options = [
+            self._additional_options(kind) for kind in (None, 'exec', 'run')
+        ]
+        return json.dumps([self.name, str(self.image), options])
+
     def get_data(self):
         """
         Run analysis commands in the container to get informations about the
@@ -448,47 +672,40 @@ class Container:
         A library set with data about libraries listed in library_set will
         be returned
         """
-        outstream = sys.stdout
-
         if self.cache:
             return set()
 
-        # Obfuscate stdout to access the output of the below commands
-        with TemporaryFile() as buffer:
-            # Most likely is the source of the errors observed in https://github.com/E4S-Project/e4s-cl/issues/100
-            sys.stdout = buffer
-
-            code = self.run(['cat', '/etc/ld.so.cache'], overload=False)
-
-            if code:
-                raise AnalysisError(code)
+        key = self._analysis_key()
+        analysis = _ANALYSES.get(key)
+        if analysis is not None:
+            libc_v, cache = analysis
+            self.libc_v, self.cache = Version(libc_v), dict(cache)
+            LOGGER.debug("Using cached analysis of image %s", self.image)
+            return set()
 
-            sys.stdout.seek(0, 0)
-            cache_data = sys.stdout.read()
+        code, cache_data = self.run(['cat', '/etc/ld.so.cache'],
+                                    overload=False,
+                                    capture_stdout=True)
 
-            # Extract version info from the cache
-            glib_version_string = get_generator(cache_data)
-            if glib_version_string is not None:
-                self.libc_v = Version(glib_version_string)
-            else:
-                # for older caches, grab the version from the ldconfig binary
-                sys.stdout.seek(0, 0)
-                sys.stdout.truncate(0)
-                code = self.run(['ldconfig', '--version'], overload=False)
-                sys.stdout.seek(0, 0)
-                glib_version = sys.stdout.read().decode()
-                self.libc_v = Version(glib_version)
+        if code:
+            raise AnalysisError(code)
 
-            LOGGER.debug("Detected container glibc version: %s", self.libc_v)
+        # Extract version info from the cache
+        glib_version_string = get_generator(cache_data)
+        if glib_version_string is None:
+            # for older caches, grab the version from the ldconfig binary
+            code, glib_version = self.run(['ldconfig', '--version'],
+                                          overload=False,
+                                          capture_stdout=True)
+            glib_version_string = glib_version.decode()
+        self.libc_v = Version(glib_version_string)
 
-            # Extract libraries from the cache
-            with NamedTemporaryFile('wb', delete=False) as cache_buffer:
-                cache_buffer.write(cache_data)
-                buffer_name = cache_buffer.name
+        LOGGER.debug("Detected container glibc version: %s", self.libc_v)
 
-            self.cache = cache_libraries(buffer_name)
+        # Extract libraries from the cache
+        self.cache = cache_libraries_data(cache_data)
 
-        sys.stdout = outstream
+        _ANALYSES[key] = (str(self.libc_v), dict(self.cache))
 
         return set()
 
@@ -507,20 +724,54 @@ class Container:
         if not path:
             return
 
-        new_binds = set()
         if not dest:
-            for _path in _unrelative(path):
-                new_binds.add(BoundFile(_path, _path, option))
-        else:
-            new_binds.add(BoundFile(Path(path), Path(dest), option))
+            self.bind_files([path], option=option)
+            return
+
+        # Normalize the destination once, for backends to compare it as is
+        _optimize_bind_addition(
+            BoundFile(path if isinstance(path, Path) else Path(path),
+                      Path(os.path.normpath(dest)), option), self._bound_files)
+
+        self._bound_cache = None
+
+    def bind_files(self,
+                   paths: Iterable[Union[Path, str]],
+                   option: int = FileOptions.READ_ONLY) -> None:
+        """
+        Bind multiple files to the same location in the container, handling
+        relative paths as bind_file does. The binds are added from the
+        shallowest to the deepest, so that files contained in bound
+        directories are merged as soon as they are added.
+        """
+        new_binds = {
+            BoundFile(_path, _path, option)
+            for path in paths if path for _path in _unrelative(path)
+        }
+
+        for bind in sorted(new_binds, key=lambda bind: len(bind.origin.parts)):
+            _optimize_bind_addition(bind, self._bound_files)
 
-        for bind in new_binds:
-            self._bound_files = optimize_bind_addition(bind, self._bound_files)
+        self._bound_cache = None
 
     @property
-    def bound(self):
+    def bound(self) -> Tuple[BoundFile, ...]:
+        """
+        Bound files to pass to the container. The existence of the files is
+        checked: this is meant to be used when launching the container, other
+        uses should rely on the requested binds in _bound_files.
+
+        The result is kept until another file is bound, for the backends
+        to go through it multiple times without checking the files again.
+        """
+        if self._bound_cache is None:
+            self._bound_cache = tuple(self._check_bound())
+        return self._bound_cache
+
+    def _check_bound(self) -> Iterable[BoundFile]:
+        existing = _existing(bound.origin for bound in self._bound_files)
         for bound in self._bound_files:
-            if bound.origin.exists() and bound.destination.is_absolute():
+            if bound.origin in existing and bound.destination.is_absolute():
                 yield bound
             else:
                 LOGGER.warning(
@@ -534,14 +785,15 @@ class Container:
         self.env.update({key: value})
 
     def add_ld_preload(self, path):
-        if path not in self.ld_preload:
-            self.ld_preload.append(path)
+        self.ld_preload.setdefault(path)
 
     def add_ld_library_path(self, path):
-        if path not in self.ld_lib_path:
-            self.ld_lib_path.append(path)
+        self.ld_lib_path.setdefault(path)
 
-    def run(self, command: List[str], overload: bool = True) -> int:
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
         """
         run a command in a container.
 
@@ -556,6 +808,9 @@ class Container:
         If the `overload` flag is set to false, the container is started
         without any of the configuration from the Container object. This
         is used to perform analysis commands in a clean environment.
+
+        If the `capture_stdout` flag is set, the standard output of the
+        command is returned as bytes alongside the return code, as a tuple.
         """
         raise NotImplementedError(
             f"`run` method not implemented for container module {self.__class__.__name__}"
@@ -567,70 +822,54 @@ class Container:
         if self.image:
             out.append(f"- image: {self.image}")
         bound_files = "\n".join([
-            f"\t{v.origin} -> {v.destination} ({v.option})" for v in self.bound
+            f"\t{v.origin} -> {v.destination} ({v.option})"
+            for v in self._bound_files
         ])
         out.append(f"- bound:\n{bound_files}")
         if self.env:
             out.append(f"- env: { json.dumps(self.env, indent=2)}")
         if self.ld_preload:
             out.append(
-                f"- LD_PRELOAD: {json.dumps(self.ld_preload, indent=2)}")
+                f"- LD_PRELOAD: {json.dumps(list(self.ld_preload), indent=2)}")
         if self.ld_lib_path:
             out.append(
-                f"- LD_LIBRARY_PATH: {json.dumps(self.ld_lib_path, indent=2)}")
+                f"- LD_LIBRARY_PATH: {json.dumps(list(self.ld_lib_path), indent=2)}")
         return '\n'.join(out)
 
 
 def guess_backend(path):
-    suffix = Path(path).suffix
-
-    matches = list(filter(lambda x: x[0] == suffix, MIMES))
+    matches = MIMES.get(Path(path).suffix, [])
 
     # If we cannot associate a unique backend to a MIME
     if len(matches) != 1:
         return None
 
-    return matches[0][1]
+    return matches[0]
 
 
-def assert_module(_module) -> bool:
+@lru_cache(maxsize=None)
+def _load_backend(name: str) -> Optional[type]:
     """
-    Assert a module defining a container class is properly structured
+    Import the module of a registered backend on first use, and return its
+    class. Returns None if the module cannot be imported.
     """
-    required = ['NAME', 'CLASS']
-
-    for attribute in required:
-        if not hasattr(_module, attribute):
-            LOGGER.warning(
-                "Container module '%s' is missing a required attribute: %s; skipping ...",
-                _module.__name__, required)
-            return False
-
-    if getattr(_module, 'CLASS') and not getattr(_module.CLASS, 'run'):
-        LOGGER.warning(
-            "Container module '%s' has an incomplete module class; skipping ..."
-        )
-
-    return True
-
-
-for _, _module_name, _ in walk_packages(__path__, prefix=__name__ + "."):
+    module_name, class_name = BACKENDS[name]
     try:
-        import_module(_module_name)
-    except ModuleNotFoundError:
-        continue
-
-    _module = sys.modules[_module_name]
-
-    if not assert_module(_module):
-        continue
+        module = import_module(module_name)
+    except ImportError as err:
+        LOGGER.debug("Failed to import container module '%s': %s",
+                     module_name, str(err))
+        return None
 
-    BACKENDS.update({
-        _module.NAME: _module_name,
-    })
+    return getattr(module, class_name)
 
-    if not getattr(_module, 'DEBUG_BACKEND', False):
-        EXPOSED_BACKENDS.append(_module.NAME)
 
-    for mimetype in getattr(_module, 'MIMES', []):
-        MIMES.append((mimetype, _module.NAME))
+def __getattr__(name):
+    """
+    Import backend submodules on attribute access, as they are not imported
+    along with this module
+    """
+    module_name = f"{__name__}.{name}"
+    if module_name in (module for module, _ in BACKENDS.values()):
+        return import_module(module_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,10 @@ Module introducing singularity support
 
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Tuple, Union
 from e4s_cl import logger
 from e4s_cl.util import run_subprocess
-from e4s_cl.cf.libraries import cache_libraries
+from e4s_cl.cf.libraries import nvidia_libraries_available
 from e4s_cl.cf.containers import Container, FileOptions, BackendNotAvailableError
 
 LOGGER = logger.get_logger(__name__)
@@ -46,12 +46,17 @@ class ApptainerContainer(Container):
         """
         Format a list of files to a compatible bind option of singularity
         """
+        # Do not set an empty variable if there is nothing to bind
+        if not self.bound:
+            return
 
-        def _format():
-            for file in self.bound:
-                yield f"{file.origin}:{file.destination}:{OPTION_STRINGS[file.option]}"
-
-        self.env.update({"APPTAINER_BIND": ','.join(_format())})
+        self.env.update({
+            "APPTAINER_BIND":
+            ','.join([
+                f"{file.origin}:{file.destination}:{OPTION_STRINGS[file.option]}"
+                for file in self.bound
+            ])
+        })
 
     def _prepare(self, command: List[str], overload: bool = True) -> List[str]:
         """
@@ -84,19 +89,24 @@ class ApptainerContainer(Container):
     def _has_nvidia(self):
         # Assume that the proper ldconfig call has been run and that nvidia
         # libraries are listed in the cache
-        if 'nvidia' not in " ".join(cache_libraries()):
+        if not nvidia_libraries_available():
             LOGGER.debug("Disabling Nvidia support: no libraries found")
             return False
         return True
 
-    def run(self, command: List[str], overload: bool = True) -> int:
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
         executable = self._executable()
         if executable is None:
             raise BackendNotAvailableError(self.__class__.__name__)
 
         container_cmd = [executable, *self._prepare(command, overload)]
 
-        return run_subprocess(container_cmd, env=self.env)
+        return run_subprocess(container_cmd,
+                              env=self.env,
+                              capture_output=capture_stdout)
 
 
 CLASS = ApptainerContainer
@@ -3,11 +3,11 @@ Module introducing singularity support
 """
 
 import os
+import shutil
 from pathlib import Path
-from typing import List, Union, Optional
+from typing import Iterable, List, Union, Optional, Tuple
 from e4s_cl import logger, BAREBONES_SCRIPT, BAREBONES_LIBRARY_DIR
-from e4s_cl.util import run_subprocess, create_symlink, empty_dir, mkdirp, list_directory_files
-from e4s_cl.cf.libraries import cache_libraries
+from e4s_cl.util import run_subprocess, create_symlink, mkdirp
 from e4s_cl.cf.containers import Container, FileOptions, BackendNotAvailableError
 from e4s_cl.cf.wi4mpi import wi4mpi_root
 
@@ -18,6 +18,9 @@ MIMES = []
 
 OPTION_STRINGS = {FileOptions.READ_ONLY: 'ro', FileOptions.READ_WRITE: 'rw'}
 
+_SCRIPT_PATH = Path(BAREBONES_SCRIPT)
+_IMPORT_LIBRARY_DIR = Path(BAREBONES_LIBRARY_DIR)
+
 
 class BarebonesContainer(Container):
     """
@@ -27,10 +30,10 @@ class BarebonesContainer(Container):
     executable_name = ''
 
     def __init__(self, *args, **kwargs):
-        if Path(BAREBONES_LIBRARY_DIR).is_dir():
-            empty_dir(Path(BAREBONES_LIBRARY_DIR))
-        else:
-            mkdirp(Path(BAREBONES_LIBRARY_DIR))
+        # Remove the links left by a previous run along with the directory,
+        # then create it again
+        shutil.rmtree(_IMPORT_LIBRARY_DIR, ignore_errors=True)
+        mkdirp(_IMPORT_LIBRARY_DIR)
         super().__init__(*args, **kwargs)
 
     def _working_dir(self):
@@ -49,22 +52,27 @@ class BarebonesContainer(Container):
 
     @property
     def script(self):
-        return Path(BAREBONES_SCRIPT)
+        return _SCRIPT_PATH
 
     @property
     def import_library_dir(self):
-        return Path(BAREBONES_LIBRARY_DIR)
+        return _IMPORT_LIBRARY_DIR
 
     def _format_bound(self):
         """
         Format a list of files to a compatible bind option of singularity
         """
+        # Do not set an empty variable if there is nothing to bind
+        if not self.bound:
+            return
 
-        def _format():
-            for file in self.bound:
-                yield f"{file.origin}:{file.destination}:{OPTION_STRINGS[file.option]}"
-
-        self.env.update({"BAREBONES_BIND": ','.join(_format())})
+        self.env.update({
+            "BAREBONES_BIND":
+            ','.join([
+                f"{file.origin}:{file.destination}:{OPTION_STRINGS[file.option]}"
+                for file in self.bound
+            ])
+        })
 
 
     def list_directory_sofiles(self, path: Path):
@@ -76,12 +84,18 @@ class BarebonesContainer(Container):
         Returns:
             A list of paths of the so files in the given directory.
         """
-        file_paths = list_directory_files(path)
-        sofile_paths = []
-        for file_path in file_paths:
-            if '.so' in file_path.suffixes: # Check if it is a library file
-                sofile_paths.append(file_path.absolute())
-        return sofile_paths
+        def _is_library(name: str) -> bool:
+            # Same test as '.so' in Path(name).suffixes
+            return not name.endswith('.') and 'so' in name.lstrip('.').split(
+                '.')[1:]
+
+        # The entries are symlinks to the bound libraries: list them by name
+        # in a single pass; callers check whether the targets exist
+        with os.scandir(path) as entries:
+            return [
+                Path(os.path.abspath(entry.path)) for entry in entries
+                if _is_library(entry.name)
+            ]
 
     def _prepare(self, command: List[str], overload: bool = True) -> List[str]:
         """
@@ -92,9 +106,11 @@ class BarebonesContainer(Container):
         wi4mpi_install_dir = wi4mpi_root()
         # If WI4MPI is to be used, we don't preload the mpi's libraries
         if wi4mpi_install_dir is None:
-            to_be_preloaded = self.list_directory_sofiles(Path(BAREBONES_LIBRARY_DIR))
+            to_be_preloaded = self.list_directory_sofiles(_IMPORT_LIBRARY_DIR)
             for file_path in to_be_preloaded:
-                self.add_ld_preload(str(file_path))
+                # Skip dangling links, the linker would fail to preload them
+                if os.path.isfile(file_path):
+                    self.add_ld_preload(str(file_path))
             self.env.update(
                 {'LD_PRELOAD': ":".join(self.ld_preload)})
 
@@ -103,7 +119,6 @@ class BarebonesContainer(Container):
         # from singularity (--nv flag) but causes MORE crashes with client containers
         # self.env.update({'SINGULARITYENV_LD_LIBRARY_PATH': ":".join(self.ld_lib_path)})
         self._format_bound()
-        nvidia_flag = ['--nv'] if self._has_nvidia() else []
 
         return [
             *self._additional_options(),
@@ -127,30 +142,37 @@ class BarebonesContainer(Container):
         if dest is not None:
             dest = Path(dest)
             if dest.name == 'barebones_script':
-                dest.write_text(file_to_bind.read_text())
+                shutil.copyfile(file_to_bind, dest)
                 os.chmod(dest, 0o755)
             else:
                 create_symlink(file_to_bind, Path(dest))
         else:
-            create_symlink(file_to_bind, Path(BAREBONES_LIBRARY_DIR) / file_basename)
+            create_symlink(file_to_bind, _IMPORT_LIBRARY_DIR / file_basename)
 
+    def bind_files(self,
+                   paths: Iterable[Union[Path, str]],
+                   option: int = FileOptions.READ_ONLY) -> None:
+        """
+        Make the given files available as bind_file does for each one, as
+        the barebones backend does not use the bound files of the base class
+        """
+        for path in paths:
+            if path:
+                self.bind_file(path, option=option)
 
     def bind_env_var(self, key, value):
         self.env.update({f"{key}": value})
 
-    def _has_nvidia(self):
-        # Assume that the proper ldconfig call has been run and that nvidia
-        # libraries are listed in the cache
-        if 'nvidia' not in " ".join(cache_libraries()):
-            LOGGER.debug("Disabling Nvidia support: no libraries found")
-            return False
-        return True
-
-    def run(self, command: List[str], overload: bool = True) -> int:
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
 
         container_cmd = [*self._prepare(command, overload)]
 
-        return run_subprocess(container_cmd, env=self.env)
+        return run_subprocess(container_cmd,
+                              env=self.env,
+                              capture_output=capture_stdout)
 
 
 CLASS = BarebonesContainer
@@ -5,7 +5,9 @@ Needs the docker module from extras
 
 import os
 import sys
-from typing import List
+import codecs
+import threading
+from typing import List, Tuple, Union
 # pylint: disable=import-error
 import docker
 from e4s_cl.logger import get_logger
@@ -23,18 +25,26 @@ class DockerContainer(Container):
     Class used to abstract docker containers
     """
 
-    def run(self, command: List[str], overload: bool = True) -> int:
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
         # Create the client from the environment
         client = docker.from_env()
 
+        try:
+            return self._run(client, command, capture_stdout)
+        finally:
+            client.close()
+
+    def _run(self, client, command: List[str],
+             capture_stdout: bool) -> Union[int, Tuple[int, bytes]]:
         # Ensure the queried image is accessible
         try:
             image = client.images.get(self.image)
         except docker.errors.ImageNotFound as err:
-            client.close()
             raise BackendError('docker') from err
         except docker.errors.APIError as err:
-            client.close()
             raise BackendNotAvailableError('docker') from err
 
         mounts = []
@@ -54,29 +64,75 @@ class DockerContainer(Container):
                 container_env[key] = val
 
         try:
-            outlog = client.containers.run(image,
-                                           command,
-                                           environment=container_env,
-                                           stdout=True,
-                                           stderr=True,
-                                           mounts=mounts,
-                                           remove=True)
+            container = client.containers.run(image,
+                                              command,
+                                              environment=container_env,
+                                              mounts=mounts,
+                                              detach=True)
         except docker.errors.ImageNotFound as err:
             raise BackendError('docker') from err
         except docker.errors.APIError as err:
             raise BackendNotAvailableError('docker') from err
-        except docker.errors.ContainerError as err:
-            LOGGER.error("Process in container %s failed with code %d:",
-                         err.container.short_id, err.exit_status)
-            for line in err.stderr.decode().split("\n"):
-                LOGGER.error(line)
-            return err.exit_status
-        else:
-            print(outlog.decode(), file=sys.stdout, end='')
+
+        # Forward the output as it is produced instead of once the container
+        # exits, each log to its stream; when captured, only the standard
+        # output is kept
+        output = []
+        try:
+            if capture_stdout:
+                output = list(
+                    container.logs(stdout=True,
+                                   stderr=False,
+                                   stream=True,
+                                   follow=True))
+            else:
+                errors = threading.Thread(target=_forward,
+                                          args=(container, False,
+                                                sys.stderr),
+                                          daemon=True)
+                errors.start()
+                _forward(container, True, sys.stdout)
+                errors.join()
+
+            exit_status = container.wait()['StatusCode']
+
+            if exit_status:
+                LOGGER.error("Process in container %s failed with code %d:",
+                             container.short_id, exit_status)
+                if capture_stdout:
+                    for line in container.logs(
+                            stdout=False,
+                            stderr=True).decode(errors='replace').split("\n"):
+                        LOGGER.error(line)
+        except docker.errors.APIError as err:
+            raise BackendNotAvailableError('docker') from err
         finally:
-            client.close()
+            try:
+                container.remove(force=True)
+            except docker.errors.APIError as err:
+                LOGGER.debug("Failed to remove container %s: %s",
+                             container.short_id, str(err))
 
-        return 0
+        if capture_stdout:
+            return exit_status, b''.join(output)
+        return exit_status
+
+
+def _forward(container, stdout: bool, stream) -> None:
+    """
+    Follow the standard output or error logs of a container, and write them to
+    the given stream as they are produced
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    try:
+        for chunk in container.logs(stdout=stdout,
+                                    stderr=not stdout,
+                                    stream=True,
+                                    follow=True):
+            stream.write(decoder.decode(chunk))
+    finally:
+        stream.write(decoder.decode(b'', final=True))
+        stream.flush()
 
 
 CLASS = DockerContainer
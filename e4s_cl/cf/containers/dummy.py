@@ -2,7 +2,7 @@
 Dummy container used during tests
 """
 
-from typing import List
+from typing import List, Tuple, Union
 from e4s_cl.cf.containers import Container
 
 DEBUG_BACKEND = True
@@ -13,8 +13,12 @@ MIMES = []
 
 class DummyContainer(Container):
 
-    def run(self, command: List[str], overload: bool = True) -> int:
-        pass
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
+        if capture_stdout:
+            return 0, b''
 
 
 CLASS = DummyContainer
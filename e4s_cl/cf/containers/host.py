@@ -5,7 +5,7 @@ Containerless support
 import os
 import tempfile
 from pathlib import Path
-from typing import List
+from typing import List, Tuple, Union
 from e4s_cl import CONTAINER_SCRIPT
 from e4s_cl.util import which, run_subprocess
 from e4s_cl.logger import get_logger
@@ -56,22 +56,30 @@ class Containerless(Container):
         """
         Create symlinks to bound libraries in a temporary directory
         """
+        prefix = f"{self.import_dir.as_posix()}/"
+        links = []
         for file in self.bound:
             # Abort if not a file
-            if not file.origin.resolve().is_file():
+            source = os.path.realpath(file.origin)
+            if not os.path.isfile(source):
                 continue
 
             # Abort if not bound in the special dir
-            try:
-                rel = file.destination.relative_to(self.import_dir)
-            except ValueError:
+            destination = file.destination.as_posix()
+            if not destination.startswith(prefix):
                 LOGGER.debug("%s is not in %s", file.destination,
                              self.import_dir)
                 continue
 
-            link = Path(self._lib_dir.name, rel)
-            os.makedirs(link.parent, exist_ok=True)
-            os.symlink(file.origin.resolve(), link)
+            links.append(
+                (source, Path(self._lib_dir.name, destination[len(prefix):])))
+
+        # Create every parent directory once before creating the links
+        for parent in {link.parent for _, link in links}:
+            os.makedirs(parent, exist_ok=True)
+
+        for source, link in links:
+            os.symlink(source, link)
 
         ld_path = os.environ.get("LD_LIBRARY_PATH")
 
@@ -82,13 +90,19 @@ class Containerless(Container):
 
         self.env["LD_LIBRARY_PATH"] = ld_path
 
-    def run(self, command: List[str], overload: bool = True) -> int:
-        if not which(self.executable):
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
+        # The executable was looked up on creation, check it is still there
+        if not (self.executable and os.access(self.executable, os.X_OK)):
             raise BackendNotAvailableError(self.executable)
 
         self._setup_import()
 
-        return run_subprocess(command, env=self.env)
+        return run_subprocess(command,
+                              env=self.env,
+                              capture_output=capture_stdout)
 
 
 CLASS = Containerless
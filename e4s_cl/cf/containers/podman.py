@@ -3,8 +3,9 @@ Podman container manager support
 """
 
 import os
+import fcntl
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Set, Tuple, Union
 from e4s_cl.error import InternalError
 from e4s_cl.util import run_subprocess
 from e4s_cl.logger import get_logger
@@ -25,13 +26,17 @@ def opened_fds():
     """
     fds = set()
 
-    for file in Path('/proc/self/fd').glob('*'):
-        if not file.exists():
+    # Listing the directory opens a file descriptor, listed but closed once
+    # done. Check the listed descriptors are valid with fcntl, which does not
+    # access the opened files as stat does
+    for name in os.listdir('/proc/self/fd'):
+        if not name.isdigit():
             continue
 
+        fd_no = int(name)
         try:
-            fd_no = int(file.name)
-        except ValueError:
+            fcntl.fcntl(fd_no, fcntl.F_GETFD)
+        except OSError:
             continue
 
         fds.add(fd_no)
@@ -45,17 +50,22 @@ class FDFiller:
     contiguous list, and make every fd inheritable
     """
 
-    def __init__(self):
+    def __init__(self, fds: Optional[Set[int]] = None):
         """
-        Initialize by creating a buffer of opened files
+        Initialize by creating a buffer of opened files. The opened file
+        descriptors are listed on entry, unless given as an argument.
         """
         self.__opened_files = []
+        self.__fds = fds
+
+        # Contiguous file descriptors, available once entered
+        self.fds = set()
 
     def __enter__(self):
         """
         Create as many open files as necessary
         """
-        fds = opened_fds()
+        fds = self.__fds if self.__fds is not None else opened_fds()
 
         # Make every existing file descriptor inheritable
         for fd in fds:
@@ -65,36 +75,37 @@ class FDFiller:
                 if err.errno == 9:
                     continue
 
-        # Compute all the missing numbers in the list
-        missing = set(range(max(fds))) - set(fds)
+        # Compute all the missing numbers in the list, without building the
+        # full range of descriptors
+        missing = {fd for fd in range(max(fds)) if fd not in fds}
 
         while missing:
-            # Open files towards /dev/null
-            null = open('/dev/null', 'w', encoding='utf-8')
+            # Open raw descriptors towards /dev/null, without a file object
+            null = os.open('/dev/null', os.O_WRONLY)
 
-            if null.fileno() not in missing:
-                raise InternalError(f"Unexpected fileno: {null.fileno()}")
+            if null not in missing:
+                os.close(null)
+                raise InternalError(f"Unexpected fileno: {null}")
 
-            try:
-                # Set the file as inheritable
-                os.set_inheritable(null.fileno(), True)
-            except OSError as err:
-                if err.errno == 9:
-                    continue
+            # Set the descriptor as inheritable
+            os.set_inheritable(null, True)
 
             # It is not missing anymore
-            missing.discard(null.fileno())
+            missing.discard(null)
             self.__opened_files.append(null)
 
         passed_fds = fds - {0, 1, 2}
         LOGGER.debug("Passing %d file descriptors: (%s)", len(passed_fds), passed_fds)
         LOGGER.debug("Created %d file descriptors: %s",
-                     len(self.__opened_files),
-                     [f.fileno() for f in self.__opened_files])
+                     len(self.__opened_files), self.__opened_files)
+
+        self.fds = fds | set(self.__opened_files)
+
+        return self
 
     def __exit__(self, type_, value, traceback):
-        for file in self.__opened_files:
-            file.close()
+        for fd in self.__opened_files:
+            os.close(fd)
 
 
 class PodmanContainer(Container):
@@ -107,7 +118,7 @@ class PodmanContainer(Container):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def _fd_number(self):
+    def _fd_number(self, fds: Optional[Set[int]] = None):
         """
         -> int
         Podman requires the --preserve-fds=K option to pass file descriptors;
@@ -116,37 +127,35 @@ class PodmanContainer(Container):
         will not function if any one of them is invalid/uninheritable.
         """
 
-        fds = opened_fds() - {0, 1, 2}
+        if fds is None:
+            fds = opened_fds()
 
-        return len(fds)
+        return len(fds - {0, 1, 2})
 
     def _format_bound(self):
-
-        def _format():
-            for file in self.bound:
-                params = {
-                    'type': 'bind',
-                    'src': file.origin.as_posix(),
-                    'dst': file.destination.as_posix(),
-                }
-
-                if file.option == FileOptions.READ_ONLY:
-                    params['ro'] = 'true'
-
-                yield "--mount=" + ",".join(f"{k}={v}"
-                                            for (k, v) in params.items())
-
-        return list(_format())
-
-    def _prepare(self, command: List[str], overload: bool = True) -> List[str]:
+        return [
+            f"--mount=type=bind,src={file.origin.as_posix()},"
+            f"dst={file.destination.as_posix()}"
+            f"{',ro=true' if file.option == FileOptions.READ_ONLY else ''}"
+            for file in self.bound
+        ]
+
+    def _prepare(self,
+                 command: List[str],
+                 overload: bool = True,
+                 fds: Optional[Set[int]] = None) -> List[str]:
         """
-        Prepare a command line to run the given command in a podman container
+        Prepare a command line to run the given command in a podman container.
+        The file descriptors to pass are listed unless given in fds.
         """
 
         def _working_dir() -> List[str]:
-            cwd = os.getcwd()
-            if cwd in map(lambda x: x.origin, self.bound):
-                return ['--workdir', cwd]
+            # Work in the current directory only if it is bound to the same
+            # path in the container
+            cwd = Path(os.getcwd())
+            if any(bind.origin == cwd and bind.destination == cwd
+                   for bind in self.bound):
+                return ['--workdir', cwd.as_posix()]
             return []
 
         if overload:
@@ -156,7 +165,7 @@ class PodmanContainer(Container):
                 '--rm',  # Remove when done
                 '--ipc=host',  # Use host IPC /!\
                 '--env-host',  # Pass host environment /!\
-                f"--preserve-fds={self._fd_number()}",  # Inherit file descriptors /!\
+                f"--preserve-fds={self._fd_number(fds)}",  # Inherit file descriptors /!\
                 *_working_dir(),  # Work in the same CWD
                 *self._format_bound(),  # Bound files options
                 *self._additional_options('run'),  # Additional run options
@@ -167,21 +176,30 @@ class PodmanContainer(Container):
             podman_command = [
                 'run',  # Run a container
                 '--rm',  # Remove when done
-                f"--preserve-fds={self._fd_number()}",  # Inherit file descriptors /!\
+                f"--preserve-fds={self._fd_number(fds)}",  # Inherit file descriptors /!\
                 self.image,
                 *command,
             ]
 
         return podman_command
 
-    def run(self, command: List[str], overload: bool = True) -> int:
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
         executable = self._executable()
         if executable is None:
             raise BackendNotAvailableError(self.__class__.__name__)
 
-        with FDFiller():
-            container_cmd = [executable, *self._prepare(command, overload)]
-            return run_subprocess(container_cmd, env=self.env)
+        # Pass the descriptors listed by the filler instead of listing them
+        # again to build the command line
+        with FDFiller() as filler:
+            container_cmd = [
+                executable, *self._prepare(command, overload, fds=filler.fds)
+            ]
+            return run_subprocess(container_cmd,
+                                  env=self.env,
+                                  capture_output=capture_stdout)
 
 
 CLASS = PodmanContainer
@@ -3,12 +3,14 @@ Module introducing shifter support
 """
 
 import os
+import shutil
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-from e4s_cl import logger, CONTAINER_DIR
-from e4s_cl.util import run_subprocess, path_contains
+from typing import List, Tuple, Union
+from e4s_cl import logger, CONTAINER_DIR, PYTHON_VERSION
+from e4s_cl.util import run_subprocess
 from e4s_cl.cf.containers import Container, FileOptions, BackendNotAvailableError
 
 LOGGER = logger.get_logger(__name__)
@@ -20,23 +22,52 @@ OPTION_STRINGS = {FileOptions.READ_ONLY: 'ro', FileOptions.READ_WRITE: 'rw'}
 
 _DEFAULT_CONFIG_PATH = Path('/etc/shifter/udiRoot.conf')
 
+_CONTAINER_DIR_PREFIX = f"{CONTAINER_DIR}/"
+
+
+def _copy(source: Path, destination: Path) -> None:
+    """
+    Copy a file or directory tree as `cp -r` would, without following
+    symbolic links. Files are copied rather than linked, for changes made from
+    the container not to reach the host files
+    """
+    try:
+        if not source.is_dir() or source.is_symlink():
+            shutil.copy2(source, destination, follow_symlinks=False)
+        elif PYTHON_VERSION >= (3, 8):
+            # Merge with the trees of other binds staged in the same place
+            # pylint: disable=unexpected-keyword-arg
+            shutil.copytree(source,
+                            destination,
+                            symlinks=True,
+                            dirs_exist_ok=True)
+        else:
+            # copytree cannot merge into an existing directory before 3.8
+            with subprocess.Popen(
+                ['cp', '-r', f"{source.as_posix()}/.",
+                 destination.as_posix()]) as proc:
+                if proc.wait():
+                    raise OSError(f"cp exited with code {proc.returncode}")
+    except (OSError, shutil.Error) as err:
+        LOGGER.error("Shifter: Failed to copy %s to %s: %s",
+                     source.as_posix(), destination.as_posix(), str(err))
+
 
 def _deprettify(lines):
     """
     Reconstruct full directives out of directives separated by backslashes
     over multiple lines
     """
-    buffer, full_lines = '', []
+    parts, full_lines = [], []
 
     for line in lines:
-        buffer = buffer + line
-
-        if buffer.endswith('\\'):
-            buffer = buffer.rstrip('\\')
+        if line.endswith('\\'):
+            parts.append(line.rstrip('\\'))
             continue
 
-        full_lines.append(buffer)
-        buffer = ''
+        parts.append(line)
+        full_lines.append(''.join(parts))
+        parts.clear()
 
     return full_lines
 
@@ -45,20 +76,20 @@ def _directives_to_dict(directives):
     """
     Transform a list of strings of shape 'KEY=value[=foo]' into a dict
     """
-    entries = []
+    entries = {}
 
     # Split all the directives at the first '='
     for directive in directives:
-        parts = directive.split('=', 1)
+        key, sep, value = directive.partition('=')
 
-        if len(parts) != 2:
+        if not sep:
             LOGGER.debug("Shifter: udiRoot.conf: Unrecognized directive: '%s'",
                          directive)
             continue
 
-        entries.append(tuple(map(lambda x: x.strip(), parts)))
+        entries[key.strip()] = value.strip()
 
-    return dict(entries)
+    return entries
 
 
 def _parse_config(config_file: Path):
@@ -69,17 +100,36 @@ def _parse_config(config_file: Path):
     try:
         with open(config_file, 'r', encoding='utf-8') as config:
             config_directives = _deprettify(
-                [l.strip() for l in config.readlines()])
+                [l.strip() for l in config.read().splitlines()])
     except IOError as err:
         LOGGER.warning("Error opening configuration file: %s", str(err))
         return {}
 
-    # Remove all comments
-    config_directives = set(
-        filter(lambda x: not x.startswith('#'), config_directives))
+    # Remove all comments and organize the results in a dict
+    return _directives_to_dict(
+        directive for directive in config_directives
+        if not directive.startswith('#'))
 
-    # Organize the results in a dict
-    return _directives_to_dict(config_directives)
+
+@lru_cache()
+def _cached_config(config_file: str, _mtime: float):
+    """
+    Parse the configuration file once per modification time
+    """
+    return _parse_config(Path(config_file))
+
+
+def _load_config(config_file: Path):
+    """
+    Return the variables defined in a configuration file, parsing it only if
+    it changed since the last call. The returned dict must not be modified
+    """
+    try:
+        mtime = os.stat(config_file).st_mtime
+    except OSError:
+        return _parse_config(config_file)
+
+    return _cached_config(str(config_file), mtime)
 
 
 class ShifterContainer(Container):
@@ -95,7 +145,7 @@ class ShifterContainer(Container):
         """
         Fetch the LD_LIBRARY_PATH from the configuration file
         """
-        config = _parse_config(_DEFAULT_CONFIG_PATH)
+        config = _load_config(_DEFAULT_CONFIG_PATH)
 
         path = []
 
@@ -104,9 +154,9 @@ class ShifterContainer(Container):
             if prepend:
                 for var in prepend.split():
                     if var.startswith('LD_LIBRARY_PATH'):
-                        path.append(var.split('=')[1])
+                        path.extend(var.split('=', 1)[1].split(os.pathsep))
 
-        return os.pathsep.join(path).split(os.pathsep)
+        return tuple(path)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -117,41 +167,46 @@ class ShifterContainer(Container):
         Create a temporary directory to bind /.e4s-cl files in
         """
         volumes = [(where.as_posix(), CONTAINER_DIR)]
+        imports = []
 
         for file in self.bound:
-            if path_contains(Path('/var'), file.destination):
+            # Destinations are normalized when bound
+            destination = file.destination.as_posix()
+
+            if destination == '/var' or destination.startswith('/var/'):
                 LOGGER.debug("Omitting bind of %s to %s: forbidden bind path",
-                             str(file.origin), str(file.destination))
+                             str(file.origin), destination)
                 continue
 
-            if file.destination.as_posix().startswith(CONTAINER_DIR):
-                rebased = file.destination.as_posix()[len(CONTAINER_DIR) + 1:]
-                temporary = Path(where, rebased)
-
-                LOGGER.debug("Shifter: Creating %s for %s in %s",
-                             temporary.as_posix(), file.origin.as_posix(),
-                             file.destination.as_posix())
-                os.makedirs(temporary.parent, exist_ok=True)
-                with subprocess.Popen(
-                    ['cp', '-r',
-                     file.origin.as_posix(),
-                     temporary.as_posix()]) as proc:
-                    proc.wait()
+            if destination.startswith(_CONTAINER_DIR_PREFIX):
+                rebased = destination[len(_CONTAINER_DIR_PREFIX):]
+                imports.append((Path(where, rebased), file))
 
             elif file.origin.is_dir():
-                if file.destination.as_posix().startswith('/etc'):
+                if destination.startswith('/etc'):
                     LOGGER.error(
                         "Shifter: Backend does not support binding to '/etc'")
                     continue
 
-                volumes.append(
-                    (file.origin.as_posix(), file.destination.as_posix()))
+                volumes.append((file.origin.as_posix(), destination))
 
             else:
                 LOGGER.warning(
                     "Shifter: Failed to bind '%s': Backend does not support file"
                     "binding. Performance may be impacted.", file.origin)
 
+        # Copy directories before their contents, as copying a tree fails if
+        # its destination exists, and create every parent directory once
+        created = set()
+        for temporary, file in sorted(imports, key=lambda x: x[0].parts):
+            LOGGER.debug("Shifter: Creating %s for %s in %s",
+                         temporary.as_posix(), file.origin.as_posix(),
+                         file.destination.as_posix())
+            if temporary.parent not in created:
+                os.makedirs(temporary.parent, exist_ok=True)
+                created.add(temporary.parent)
+            _copy(file.origin, temporary)
+
         return [f"--volume={source}:{dest}" for (source, dest) in volumes]
 
     def _prepare(self, command: List[str], overload: bool = True) -> List[str]:
@@ -162,8 +217,9 @@ class ShifterContainer(Container):
             env_list.append(
                 f'--env=LD_LIBRARY_PATH={":".join(self.ld_lib_path)}')
 
-        for env_var in self.env.items():
-            env_list.append(f'--env={env_var}={env_var}')
+        # Variables set to None are unset for the process and not passed
+        env_list.extend(f'--env={key}={value}'
+                        for key, value in self.env.items() if value is not None)
 
         # The following is a variable linked to a directory created on the disk
         # Erasing this variable will erase the directory, thus the bind to self
@@ -178,14 +234,19 @@ class ShifterContainer(Container):
             *command,
         ]
 
-    def run(self, command: List[str], overload: bool = True) -> int:
+    def run(self,
+            command: List[str],
+            overload: bool = True,
+            capture_stdout: bool = False) -> Union[int, Tuple[int, bytes]]:
         executable = self._executable()
         if executable is None:
             raise BackendNotAvailableError(self.__class__.__name__)
 
         container_cmd = [executable, *self._prepare(command, overload)]
         LOGGER.debug(container_cmd)
-        return run_subprocess(container_cmd, env=self.env)
+        return run_subprocess(container_cmd,
+                              env=self.env,
+                              capture_output=capture_stdout)
 
 
 CLASS = ShifterContainer
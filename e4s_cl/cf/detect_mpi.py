@@ -2,13 +2,14 @@
 Identify a MPI vendor and version from an ELF binary
 """
 
+import os
 import re
 import ctypes
+from functools import lru_cache
 from typing import Optional, Callable, Iterable, List, Set
 from dataclasses import dataclass
 from pathlib import Path
 from e4s_cl import logger
-from e4s_cl.model.profile import Profile
 
 LOGGER = logger.get_logger(__name__)
 
@@ -28,26 +29,13 @@ def _suffix_name(name: str, existing_names: set) -> str:
     if name not in existing_names:
         return name
 
-    # An exact match exists, filter the occurrences of 'name-N' (clones)
-    # and return name-max(N)+1
-    clones = set(
-        filter(
-            None,
-            map(lambda x: re.match(fr"{re.escape(name)}-(?P<ordinal>\d*)", x),
-                existing_names)))
-
-    # Try to list all clones of this profile
-    ordinals = []
-    for clone in clones:
-        try:
-            ordinals.append(int(clone.group('ordinal')))
-        except ValueError:
-            pass
-
-    # If there are no clones, this is the second profile, after the original
-    ordinal = 2
-    if len(ordinals) != 0:
-        ordinal = max(ordinals) + 1
+    # An exact match exists, find the occurrences of 'name-N' (clones)
+    # and return name-max(N)+1. If there are no clones, this is the second
+    # profile, after the original
+    clone = re.compile(fr"{re.escape(name)}-(?P<ordinal>\d+)")
+    ordinal = max((int(match.group('ordinal'))
+                   for match in map(clone.fullmatch, existing_names) if match),
+                  default=1) + 1
 
     return f"{name}-{ordinal}"
 
@@ -138,6 +126,11 @@ VENDOR_VERSION_EXTRACTORS = {
 }
 
 
+# Single pattern matching every vendor keyword, longest first
+_VENDOR_PATTERN = re.compile('|'.join(
+    map(re.escape, sorted(VENDOR_VERSION_EXTRACTORS, key=len, reverse=True))))
+
+
 def _get_mpi_handle(path: Path) -> Optional[Callable]:
     """Get a handle to the MPI_Get_library_version symbol given a path to a
     shared object"""
@@ -153,40 +146,59 @@ def _get_mpi_handle(path: Path) -> Optional[Callable]:
         return None
 
 
-def _get_mpi_library_version(path: Path) -> str:
-    """Return the output of the MPI_Get_library_version symbol in the MPI
-    binary passed as an argument"""
-
-    if isinstance(path, str):
-        path = Path(path)
+@lru_cache(maxsize=128)
+def _library_version(path: str, _mtime: float, _size: int) -> str:
+    """Run MPI_Get_library_version from the given shared object. The
+    modification time and size are part of the cache key, so that a library
+    replaced on disk is inspected again"""
 
     # C-compatible buffer to run a C handle with
     version_buffer = ctypes.create_string_buffer(3000)
     length = ctypes.c_int()
 
     # Get a callable towards the C code
-    handle = _get_mpi_handle(path)
+    handle = _get_mpi_handle(Path(path))
     if not handle:
         LOGGER.debug("Extracting MPI_Get_library_version from %s failed",
-                     path.as_posix())
+                     path)
         return ''
 
     # Execute the C code to fill the above buffer
     handle(version_buffer, ctypes.byref(length))
 
+    # Only the start of the message is used: decode it alone, replacing the
+    # last character if the cut happens in the middle of it
     if length:
-        return version_buffer.value.decode("utf-8")[:500]
+        return version_buffer.value[:500].decode("utf-8", errors='replace')
     return ''
 
 
+def _get_mpi_library_version(path: Path) -> str:
+    """Return the output of the MPI_Get_library_version symbol in the MPI
+    binary passed as an argument"""
+
+    resolved = os.path.realpath(path)
+
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        LOGGER.debug("Extracting MPI_Get_library_version from %s failed",
+                     os.fspath(path))
+        return ''
+
+    return _library_version(resolved, stat.st_mtime, stat.st_size)
+
+
 def _get_mpi_vendor_version(path: Path) -> Optional[MPIIdentifier]:
     """Return a tuple of string according to the vendor and version of the MPI
     binary passed as an argument"""
     raw_str = _get_mpi_library_version(path)
 
-    # Check for vendor keywords in the buffer
-    filtered_buffer = list(
-        filter(lambda x: x in raw_str, VENDOR_VERSION_EXTRACTORS.keys()))
+    # Check for vendor keywords in the buffer in a single pass
+    found = set(_VENDOR_PATTERN.findall(raw_str))
+    filtered_buffer = [
+        vendor for vendor in VENDOR_VERSION_EXTRACTORS if vendor in found
+    ]
 
     # Skip this binary if none were found
     if not filtered_buffer:
@@ -221,10 +233,12 @@ def detect_mpi(path_list: Iterable[Path]) -> Optional[MPIIdentifier]:
 def filter_mpi_libs(libraries: List[Path]) -> Set[Path]:
     """Return a set of MPI libraries from a list of libraries"""
 
-    def _filter_mpi(path: Path):
-        return re.match(r'libmpi.*so.*', path.name)
-
-    return set(filter(_filter_mpi, libraries))
+    # Same as matching r'libmpi.*so.*', without a regular expression
+    return {
+        path
+        for path in libraries
+        if path.name.startswith('libmpi') and 'so' in path.name[6:]
+    }
 
 
 def library_install_dir(libraries: Iterable[Path]) -> Optional[Path]:
@@ -262,6 +276,8 @@ def profile_mpi_name(mpi_libs: Iterable[Path]) -> Optional[str]:
     Analyze the profile with the given eid for MPI libraries and rename it
     according to the vendor/version info in the shared object
     """
+    # Imported here as this is the only use of the model in this module
+    from e4s_cl.model.profile import Profile
     controller = Profile.controller()
 
     # Run the methods in the libraries to get a version
@@ -275,7 +291,10 @@ def profile_mpi_name(mpi_libs: Iterable[Path]) -> Optional[str]:
 
     # Get all profiles matching the new name
     matches = controller.match('name', regex=f"{re.escape(str(mpi_id))}.*")
-    matching_names = set(filter(None, map(lambda x: x.get('name'), matches)))
+    matching_names = {
+        match.get('name')
+        for match in matches if match.get('name')
+    }
 
     # Add a suffix to the name to avoid conflict
     return _suffix_name(str(mpi_id), matching_names)
@@ -3,6 +3,8 @@ Library analysis and manipulation helpers
 """
 
 from functools import lru_cache
+from tempfile import NamedTemporaryFile
+from typing import Dict, Optional
 
 # Symbols imported for ease of use
 # pylint: disable=W0611
@@ -24,6 +26,36 @@ from e4s_cl.util import JSON_HOOKS
 LOGGER = get_logger(__name__)
 
 
+def cache_libraries_data(data: bytes,
+                         arch_flags: Optional[int] = None) -> Dict[str, str]:
+    """
+    Same as cache_libraries, but parses the contents of a linker cache held in
+    memory instead of reading a file
+    """
+    # The parser requires a path: the file is only kept for the duration of
+    # the parsing. Its name is random, so sotools' per-path cache is not hit
+    with NamedTemporaryFile('wb') as cache_buffer:
+        cache_buffer.write(data)
+        cache_buffer.flush()
+
+        try:
+            return cache_libraries(cache_buffer.name, arch_flags)
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.error("Linker cache parsing failed: %s", str(err))
+            return {}
+
+
+@lru_cache()
+def nvidia_libraries_available():
+    """
+    -> bool
+    Check if nvidia libraries are listed in the host's linker cache
+    Caches the result
+    """
+    # Stop at the first match instead of joining all the sonames
+    return any('nvidia' in soname for soname in cache_libraries())
+
+
 @lru_cache()
 def libc_version():
     """
@@ -39,8 +71,7 @@ def libc_version():
 
     # Get the version with major 2 from the defined versions,
     # as almost all libc implementations have the GLIBC_3.4 symbol
-    libc_ver = max(
-        filter(lambda x: x and x.major == 2,
-               [Version(s) for s in data.defined_versions]))
+    versions = (Version(s) for s in data.defined_versions)
+    libc_ver = max(v for v in versions if v and v.major == 2)
 
     return libc_ver
@@ -262,6 +262,24 @@ class AbstractStorage():
             Record: The new record.
         """
 
+    @abstractmethod
+    def upsert(self, data, keys, table_name=None, match_any=False):
+        """Update records matching `keys`, or create a new record if none match.
+
+        Args:
+            data (dict): Data to record.
+            keys (dict): Fields to match.
+            table_name (str): Name of the table to operate on.  See :any:`AbstractStorage.table`.
+            match_any (bool): If True then any key in `keys` may match or if False then all keys
+                              in `keys` must match.
+
+        Returns:
+            list: Element identifiers of the updated or created records.
+
+        Raises:
+            ValueError: ``bool(keys) == False`` or invaild value for `keys`.
+        """
+
     @abstractmethod
     def update(self, fields, keys, table_name=None, match_any=False):
         """Update records.
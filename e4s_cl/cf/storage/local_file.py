@@ -3,6 +3,7 @@ Abstraction layer above `tinydb`
 """
 
 import os
+import copy
 import json
 import tempfile
 import tinydb
@@ -73,6 +74,8 @@ class LocalFileStorage(AbstractStorage):
         self._db_copy = None
         self._database = None
         self._prefix = prefix
+        # Records of whole tables, indexed by table name. Emptied on writes
+        self._search_cache = {}
 
     def __len__(self):
         return self.count()
@@ -84,10 +87,7 @@ class LocalFileStorage(AbstractStorage):
         raise KeyError
 
     def __setitem__(self, key, value):
-        if self.contains({'key': key}):
-            self.update({'value': value}, {'key': key})
-        else:
-            self.insert({'key': key, 'value': value})
+        self.upsert({'key': key, 'value': value}, {'key': key})
 
     def __delitem__(self, key):
         if not self.contains({'key': key}):
@@ -174,6 +174,7 @@ class LocalFileStorage(AbstractStorage):
         if self._database:
             self._database.close()
             self._database = None
+        self._search_cache.clear()
 
     def prefix(self):
         return self._prefix
@@ -188,7 +189,8 @@ class LocalFileStorage(AbstractStorage):
         # pylint: disable=protected-access
         if self._transaction_count == 0:
             self.connect_database()
-            self._db_copy = self._database._storage.read()
+            # Contents of the tables written to, saved on their first write
+            self._db_copy = {}
         self._transaction_count += 1
         return self
 
@@ -196,12 +198,44 @@ class LocalFileStorage(AbstractStorage):
         """Finalizes the database transaction."""
         # pylint: disable=protected-access
         self._transaction_count -= 1
-        if ex_type and self._transaction_count == 0:
-            self._database._storage.write(self._db_copy)
+        if self._transaction_count == 0:
+            if ex_type:
+                self._rollback()
             self._db_copy = None
-            return False
+            return not ex_type
         return True
 
+    def _rollback(self):
+        """Restore the tables written to during the transaction."""
+        # pylint: disable=protected-access
+        data = self._database._storage.read() or {}
+        for table_name, table in self._db_copy.items():
+            if table is None:
+                data.pop(table_name, None)
+            else:
+                data[table_name] = table
+        self._database._storage.write(data)
+
+        for table_name in self._db_copy:
+            self._database.table(table_name).clear_cache()
+        self._search_cache.clear()
+
+    def _modify(self, table_name):
+        """Prepare a write to a table.
+
+        Forgets the cached searches and, in a transaction, saves the contents of the table
+        the first time it is written to, for a rollback.
+        """
+        # pylint: disable=protected-access
+        self._search_cache.clear()
+        if self._db_copy is None:
+            return
+        self.connect_database()
+        table_name = table_name or self._database.default_table_name
+        if table_name not in self._db_copy:
+            data = self._database._storage.read() or {}
+            self._db_copy[table_name] = copy.deepcopy(data.get(table_name))
+
     def table(self, table_name):
         self.connect_database()
         if table_name is None:
@@ -308,8 +342,15 @@ class LocalFileStorage(AbstractStorage):
         table = self.table(table_name)
         if keys is None:
             #LOGGER.debug("%s: all()", table_name)
+            if table_name not in self._search_cache:
+                self._search_cache[table_name] = [
+                    self.Record(self, element=element)
+                    for element in table.all()
+                ]
+            # Hand out copies, for callers to modify them freely
             return [
-                self.Record(self, element=element) for element in table.all()
+                self.Record(self, element=record, eid=record.eid)
+                for record in self._search_cache[table_name]
             ]
 
         if isinstance(keys, self.Record.eid_type):
@@ -431,10 +472,35 @@ class LocalFileStorage(AbstractStorage):
         Returns:
             Record: The new record.
         """
+        self._modify(table_name)
         eid = self.table(table_name).insert(data)
         record = self.Record(self, eid=eid, element=data)
         return record
 
+    def upsert(self, data, keys, table_name=None, match_any=False):
+        """Update records matching `keys`, or create a new record if none match.
+
+        Both operations are performed in a single pass over the table.
+
+        Args:
+            data (dict): Data to record.
+            keys (dict): Fields to match.
+            table_name (str): Name of the table to operate on.  See :any:`AbstractDatabase.table`.
+            match_any (bool): If True then any key in `keys` may match or if False then all keys
+                              in `keys` must match.
+
+        Returns:
+            list: Element identifiers of the updated or created records.
+
+        Raises:
+            ValueError: ``bool(keys) == False`` or invaild value for `keys`.
+        """
+        if not isinstance(keys, dict) or not keys:
+            raise ValueError(keys)
+        self._modify(table_name)
+        return self.table(table_name).upsert(data,
+                                             self._query(keys, match_any))
+
     def update(self, fields, keys, table_name=None, match_any=False):
         """Update records.
         
@@ -453,6 +519,7 @@ class LocalFileStorage(AbstractStorage):
         Raises:
             ValueError: ``bool(keys) == False`` or invaild value for `keys`.
         """
+        self._modify(table_name)
         table = self.table(table_name)
         if isinstance(keys, self.Record.eid_type):
             #LOGGER.debug("%s: update(%r, eid=%r)", table_name, fields, keys)
@@ -486,6 +553,7 @@ class LocalFileStorage(AbstractStorage):
         Raises:
             ValueError: ``bool(keys) == False`` or invaild value for `keys`.
         """
+        self._modify(table_name)
         table = self.table(table_name)
         if isinstance(keys, self.Record.eid_type):
             for field in fields:
@@ -519,6 +587,7 @@ class LocalFileStorage(AbstractStorage):
         Raises:
             ValueError: ``bool(keys) == False`` or invaild value for `keys`.
         """
+        self._modify(table_name)
         table = self.table(table_name)
         if isinstance(keys, self.Record.eid_type):
             #LOGGER.debug("%s: remove(eid=%r)", table_name, keys)
@@ -538,4 +607,5 @@ class LocalFileStorage(AbstractStorage):
             table_name (str): Name of the table to operate on.  See :any:`AbstractDatabase.table`.
         """
         LOGGER.debug("%s: purge()", table_name)
+        self._modify(table_name)
         self.table(table_name).truncate()
@@ -98,8 +98,7 @@ WI4MPI_METADATA = [
 
 # Keys used to describe MPI families. Wi4MPI is needed if a pair of those keys
 # is present in the SUPPORTED_TRANSLATIONS collection
-WI4MPI_SOURCES = set(map(lambda x: x.cli_name,
-                         WI4MPI_METADATA)) | {'interface'}
+WI4MPI_SOURCES = {data.cli_name for data in WI4MPI_METADATA} | {'interface'}
 
 SUPPORTED_TRANSLATIONS = {
     ('intelmpi', 'openmpi'),
@@ -116,7 +115,7 @@ SUPPORTED_TRANSLATIONS = {
     ('openmpi', 'mvapich'),
 }
 
-_FAMILY_ENV_VARS = set(map(lambda x: x.path_key, WI4MPI_METADATA))
+_FAMILY_ENV_VARS = {data.path_key for data in WI4MPI_METADATA}
 
 # Set of all environment variables used by Wi4MPI, to pass to the underlying code
 WI4MPI_ENVIRONMENT_VARIABLES = {
@@ -239,8 +238,10 @@ def wi4mpi_libraries(install_dir: Path) -> List[Path]:
                        f"libwi4mpi_{source}_{target}.so")
 
     def _get_lib(env_name: str) -> Optional[Path]:
-        matches = set(filter(lambda x: x.env_name == env_name,
-                             WI4MPI_METADATA))
+        matches = {
+            data
+            for data in WI4MPI_METADATA if data.env_name == env_name
+        }
         if len(matches) == 1:
             distribution_data = matches.pop()
 
@@ -252,9 +253,10 @@ def wi4mpi_libraries(install_dir: Path) -> List[Path]:
     source_lib = _get_lib(source)
     target_lib = _get_lib(target)
 
-    return list(
-        filter(lambda x: x.resolve().exists(),
-               filter(None, [wrapper_lib, source_lib, target_lib])))
+    return [
+        lib for lib in [wrapper_lib, source_lib, target_lib]
+        if lib and lib.resolve().exists()
+    ]
 
 
 def wi4mpi_libpath(install_dir: Path):
@@ -317,8 +319,8 @@ def wi4mpi_find_libraries(
         Find the library with the given soname, either from the libraries
         passed in the list or from the directories they are in
         """
-        matches = set(filter(lambda x: x.name.startswith(soname), available))
-        search_directories = set(map(lambda x: x.resolve().parent, available))
+        matches = {lib for lib in available if lib.name.startswith(soname)}
+        search_directories = {lib.resolve().parent for lib in available}
 
         # If a match exists in the given libraries
         if matches:
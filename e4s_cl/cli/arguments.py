@@ -668,7 +668,9 @@ def single_defined_object(model, field):
 
         matches = _search_available_databases(model, field,
                                               f"^{re.escape(string)}.*")
-        exact_matches = list(filter(lambda x: x.get(field) == string, matches))
+        exact_matches = [
+            match for match in matches if match.get(field) == string
+        ]
 
         # If multiple matches occur, return the first occurence
         if len(exact_matches) > 1:
@@ -202,8 +202,9 @@ def generate_rtld_path(container: Container,
     path_list = []
 
     if wi4mpi_install_dir is not None:
-        wi4mpi_paths = list(
-            map(lambda x: x.as_posix(), wi4mpi_libpath(wi4mpi_install_dir)))
+        wi4mpi_paths = [
+            path.as_posix() for path in wi4mpi_libpath(wi4mpi_install_dir)
+        ]
 
         path_list += wi4mpi_paths
 
@@ -299,8 +300,8 @@ class ExecuteCommand(AbstractCommand):
             container.get_data()
 
         # Bind all accessible requested files
-        for path in filter(_check_access, args.files or []):
-            container.bind_file(path, option=FileOptions.READ_WRITE)
+        container.bind_files(filter(_check_access, args.files or []),
+                             option=FileOptions.READ_WRITE)
 
         # This script is sourced before any other command in the container
         params.source_script_path = args.source
@@ -136,7 +136,7 @@ class MainCommand(AbstractCommand):
 
         # Get a list of valid option strings from the parser
         option_strings = util.flatten(
-            map(lambda x: x.option_strings, self.parser.actions))
+            [action.option_strings for action in self.parser.actions])
 
         # If the error is not related to the omission of subcommand
         if not empty and not command:
@@ -184,7 +184,7 @@ class MainCommand(AbstractCommand):
 
             # Get a list of valid option strings from the parser
             option_strings = util.flatten(
-                map(lambda x: x.option_strings, self.parser.actions))
+                [action.option_strings for action in self.parser.actions])
 
             # Insert `launch` after any valid option string for e4s-cl
             for arg in argv:
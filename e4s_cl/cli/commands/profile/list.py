@@ -109,9 +109,10 @@ def _valid_columns(names: List[str]) -> List[Dict]:
         """
         Compare lowercase names to support case insensitivity
         """
-        matches = list(
-            filter(lambda x: x['header'].lower() == name.lower(),
-                   DEFINED_DASHBOARD_COLUMNS))
+        matches = [
+            definition for definition in DEFINED_DASHBOARD_COLUMNS
+            if definition['header'].lower() == name.lower()
+        ]
         if matches:
             return matches[0]
 
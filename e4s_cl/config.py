@@ -23,6 +23,29 @@ def update_configuration(configuration):
     CONFIGURATION = configuration
 
 
+_FLATTEN_SEPARATOR = '_'
+
+
+def _prefixed(prefix, string):
+    return str(_FLATTEN_SEPARATOR.join(filter(None, [prefix, string])))
+
+
+def _flatten(prefix, data: dict):
+    flat = {}
+
+    if not data:
+        return flat
+
+    for key, value in data.items():
+        if isinstance(value, dict):
+            for ckey, cval in _flatten(str(key), value).items():
+                flat.update({_prefixed(prefix, ckey): cval})
+        else:
+            flat.update({_prefixed(prefix, key): value})
+
+    return flat
+
+
 def flatten(data):
     """
     Transform nested dictionaries into key value pairs by prefixing the
@@ -31,27 +54,7 @@ def flatten(data):
 
     => dict(root_key1=0, root_key2='test')
     """
-    separator = '_'
-
-    def _pre(prefix, string):
-        return str(separator.join(filter(None, [prefix, string])))
-
-    def _intermediate(prefix, data: dict):
-        flat = {}
-
-        if not data:
-            return flat
-
-        for key, value in data.items():
-            if isinstance(value, dict):
-                for ckey, cval in _intermediate(str(key), value).items():
-                    flat.update({_pre(prefix, ckey): cval})
-            else:
-                flat.update({_pre(prefix, key): value})
-
-        return flat
-
-    return _intermediate('', data)
+    return _flatten('', data)
 
 
 @dataclass(frozen=True)
@@ -186,8 +189,19 @@ class Configuration:
             raise TypeError(f"unsupported operand type(s) for |: "
                             f"'{type(self)}' and '{type(rhs)}'")
 
-        # Merge the two dictionaries (Use | on py39)
-        return Configuration({**self._fields, **rhs._fields})
+        return Configuration.merge(self, rhs)
+
+    @classmethod
+    def merge(cls, *configurations):
+        """
+        Merge any number of configuration objects in a single pass. The last
+        objects have priority, and their keys will take precedence
+        """
+        fields = {}
+        for configuration in configurations:
+            fields.update(configuration._fields)
+
+        return cls(fields)
 
     def __str__(self):
         return str(self._fields)
@@ -350,7 +364,9 @@ ALLOWED_CONFIG = ConfigurationGroup(
 
 CONFIGURATION = Configuration.default()
 if not E4S_CL_TEST:
-    CONFIGURATION = CONFIGURATION  \
-        | Configuration.create_from_file(SYSTEM_CONFIG_PATH) \
-        | Configuration.create_from_file(INSTALL_CONFIG_PATH) \
-        | Configuration.create_from_file(USER_CONFIG_PATH)
+    CONFIGURATION = Configuration.merge(
+        CONFIGURATION,
+        Configuration.create_from_file(SYSTEM_CONFIG_PATH),
+        Configuration.create_from_file(INSTALL_CONFIG_PATH),
+        Configuration.create_from_file(USER_CONFIG_PATH),
+    )
@@ -235,11 +235,13 @@ class Model(StorageRecord, metaclass=ModelMeta):
         """
         if data is None:
             return None
+        # Resolve the attributes property once instead of once per key
+        attributes = cls.attributes
         for key in data:
-            if key not in cls.attributes:
+            if key not in attributes:
                 raise ModelError(cls, f"no attribute named '{key}'")
         validated = {}
-        for attr, props in cls.attributes.items():
+        for attr, props in attributes.items():
             # Check required fields and defaults
             try:
                 validated[attr] = data[attr]
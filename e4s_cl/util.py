@@ -18,6 +18,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Tuple,
     Union,
 )
 from functools import lru_cache, reduce
@@ -81,9 +82,24 @@ def mkdirp(path: Path) -> bool:
     return True
 
 
-@lru_cache()
-def which(*args, **kwargs):
-    return sh_which(*args, **kwargs)
+@lru_cache(maxsize=None)
+def _which(cmd, mode: int, path: str) -> Optional[str]:
+    return sh_which(cmd, mode=mode, path=path)
+
+
+def which(cmd, mode: int = os.F_OK | os.X_OK, path: Optional[str] = None):
+    """
+    Memoized shutil.which. The value of PATH is part of the cache key, so
+    results are recomputed when the environment changes
+    """
+    if path is None:
+        path = os.environ.get('PATH', os.defpath)
+    return _which(cmd, mode, path)
+
+
+def invalidate_which_cache() -> None:
+    """Forget the results of which, e.g. after installing executables"""
+    _which.cache_clear()
 
 
 def get_env(var: str) -> Optional[str]:
@@ -96,6 +112,9 @@ def get_env(var: str) -> Optional[str]:
     )
 
 
+_ACCESS_MODES = {'r': os.R_OK, 'w': os.W_OK, 'x': os.X_OK}
+
+
 def path_accessible(path: Path, mode: str = 'r') -> bool:
     """Check if a file or directory exists and is accessible.
     
@@ -114,32 +133,54 @@ def path_accessible(path: Path, mode: str = 'r') -> bool:
     if isinstance(path, str):
         path = Path(path)
 
-    modes = {'r': os.R_OK, 'w': os.W_OK, 'x': os.X_OK}
-
     if not mode:
         raise InternalError(f"Unsupported value for mode: '{mode}'")
     for element in mode:
-        if element not in modes:
+        if element not in _ACCESS_MODES:
             raise InternalError(f"Unsupported value for mode: '{element}'")
 
     modebits = 0
     for char in mode:
-        modebits |= modes[char]
+        modebits |= _ACCESS_MODES[char]
     return os.access(path.as_posix(), os.F_OK) and os.access(
         path.as_posix(), modebits)
 
 
-def run_subprocess(cmd, cwd=None, env=None, discard_output=False) -> int:
+def _inherited(stream, fd: int):
+    """
+    Return None if the given stream writes to the given file descriptor of
+    this process, for the child to inherit it. Passing the stream itself
+    prevents subprocess from launching the child with posix_spawn, which
+    avoids forking a large process
+    """
+    try:
+        if stream.fileno() == fd:
+            return None
+    except (AttributeError, OSError, ValueError):
+        pass
+    return stream
+
+
+def run_subprocess(cmd,
+                   cwd=None,
+                   env=None,
+                   discard_output=False,
+                   capture_output=False) -> Union[int, Tuple[int, bytes]]:
     """
     cmd: list[str],
     env: Optional[dict]
     Run a subprocess, tailored for end subrocesses
+
+    If capture_output is set, the standard output of the process is returned
+    as bytes along with the return code, instead of being forwarded
     """
 
     subproc_env = os.environ
-    stdout, stderr = sys.stdout, subprocess.PIPE
+    stdout, stderr = _inherited(sys.stdout, 1), subprocess.PIPE
     if discard_output:
         stdout, stderr = DEVNULL, STDOUT
+    elif capture_output:
+        stdout = subprocess.PIPE
     if env:
         for key, val in env.items():
             if val is None:
@@ -158,13 +199,21 @@ def run_subprocess(cmd, cwd=None, env=None, discard_output=False) -> int:
                           stdout=stdout,
                           stderr=stderr,
                           close_fds=False,
-                          universal_newlines=True,
-                          bufsize=1) as proc:
+                          universal_newlines=not capture_output,
+                          bufsize=-1 if capture_output else 1) as proc:
         # Save the PID for later use
         pid = proc.pid
         # Setup a logger dedicated to this subprocess
         process_logger = logger.setup_process_logger(f"process.{pid}")
-        if not discard_output:
+        output = b''
+        if capture_output:
+            # Read both pipes at once, as a full stdout pipe would block the
+            # process while waiting for stderr
+            output, errors = proc.communicate()
+            for line in errors.decode(errors='replace').splitlines():
+                process_logger.error(line)
+                buffer.append(line)
+        elif not discard_output:
             with proc.stderr:
                 # Log the errors in a log file
                 for line in proc.stderr.readlines():
@@ -187,6 +236,9 @@ def run_subprocess(cmd, cwd=None, env=None, discard_output=False) -> int:
 
     del process_logger
 
+    if capture_output:
+        return returncode, output
+
     return returncode
 
 
@@ -213,8 +265,9 @@ def run_e4scl_subprocess(cmd, cwd=None, env=None, capture_output=False) -> int:
                 cmd,
                 cwd=cwd,
                 env=subproc_env,
-                stdout=subprocess.PIPE if capture_output else sys.stdout,
-                stderr=sys.stderr,
+                stdout=subprocess.PIPE
+                if capture_output else _inherited(sys.stdout, 1),
+                stderr=_inherited(sys.stderr, 2),
                 close_fds=False,
                 universal_newlines=True,
                 bufsize=1) as proc:
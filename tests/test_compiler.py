@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+import tests
+from e4s_cl.cf.compiler import (CompilerVendor, available_compilers,
+                                compiler_vendor, _get_comment)
+
+GNU_LIB = Path(tests.ASSETS, 'libgver.so.0')
+
+
+class CompilerTest(tests.TestCase):
+    def test_comment(self):
+        self.assertIn('GCC', _get_comment(GNU_LIB))
+
+    def test_comment_missing(self):
+        self.assertEqual(_get_comment(Path('/nonexistent/binary')), '')
+        self.assertEqual(_get_comment(tests.ASSETS), '')
+
+    def test_comment_not_elf(self):
+        with TemporaryDirectory() as tmpdir:
+            empty = Path(tmpdir, 'empty')
+            empty.touch()
+            self.assertEqual(_get_comment(empty), '')
+            self.assertEqual(_get_comment(tests.CONFIGURATION_FILE), '')
+
+    def test_vendor(self):
+        self.assertEqual(compiler_vendor(GNU_LIB), CompilerVendor.GNU)
+
+    def test_available_compilers(self):
+        with TemporaryDirectory() as bindir:
+            for name in ['clang', 'clang++', 'flang', 'gcc']:
+                executable = Path(bindir, name)
+                executable.touch()
+                executable.chmod(0o755)
+
+            with patch.dict(os.environ, {'PATH': bindir}):
+                self.assertSetEqual(set(available_compilers()),
+                                    {CompilerVendor.LLVM})
+
+    def test_vendor_precedence(self):
+        comments = {
+            b'GCC: (GNU) 8.5.0': CompilerVendor.GNU,
+            b'GCC: (GNU) 8.5.0\x00clang version 15.0.0': CompilerVendor.LLVM,
+            b'GCC: (GNU) 8.5.0\x00AMD clang version 15.0.0': CompilerVendor.AMD,
+            b'Unknown compiler': CompilerVendor.GNU,
+        }
+
+        for comment, vendor in comments.items():
+            with patch('e4s_cl.cf.compiler._get_comment_bytes',
+                       return_value=comment):
+                self.assertEqual(compiler_vendor(GNU_LIB), vendor)
+
+    def test_available_compilers_missing(self):
+        with TemporaryDirectory() as bindir:
+            for name in ['gcc', 'g++']:
+                executable = Path(bindir, name)
+                executable.touch()
+                executable.chmod(0o755)
+            # Not executable
+            Path(bindir, 'gfortran').touch()
+
+            with patch.dict(os.environ, {'PATH': bindir}):
+                self.assertSetEqual(set(available_compilers()), set())
@@ -60,6 +60,15 @@ launcher_options: 8"""
 
         self.assertEqual(merged._fields, expected._fields)
 
+    def test_merge_layers(self):
+        c1, c2, c3 = Configuration({'a': 1, 'b': 3}), Configuration(
+            {'a': 5}), Configuration({'b': 0, 'c': 0})
+
+        merged = Configuration.merge(c1, c2, c3)
+
+        self.assertEqual(merged._fields, dict(a=5, b=0, c=0))
+        self.assertEqual(c1._fields, {'a': 1, 'b': 3})
+
     def test_completion(self):
         c = Configuration.default()
 
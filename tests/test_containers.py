@@ -1,14 +1,31 @@
+import tempfile
+from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
+from unittest.mock import patch
 import tests
 from e4s_cl.cf.containers import (
+    BACKENDS,
+    BackendNotAvailableError,
     BackendUnsupported,
     BoundFile,
     Container,
+    EXPOSED_BACKENDS,
+    MIMES,
     FileOptions,
     optimize_bind_addition,
+    _BindTrie,
+    _contains,
+    _existing,
+    _unrelative,
+    guess_backend,
+    invalidate_analysis_cache,
 )
 
 
+LINKER_CACHE = Path('/etc/ld.so.cache')
+
+
 class ContainerTest(tests.TestCase):
 
     def test_create(self):
@@ -20,6 +37,90 @@ class ContainerTest(tests.TestCase):
         with self.assertRaises(BackendUnsupported):
             container = Container(name='UNKNOWN')
 
+    def test_backend_registry(self):
+        # The registry matches the attributes of the backend modules
+        for name, (module_name, class_name) in BACKENDS.items():
+            try:
+                module = import_module(module_name)
+            except ImportError:
+                continue
+
+            self.assertEqual(module.NAME, name)
+            self.assertEqual(module.CLASS.__name__, class_name)
+            self.assertEqual(name in EXPOSED_BACKENDS,
+                             not getattr(module, 'DEBUG_BACKEND', False))
+            for mimetype in module.MIMES:
+                self.assertIn(name, MIMES[mimetype])
+
+    @tests.skipIf(find_spec('docker'), "The docker package is installed")
+    def test_backend_missing_import(self):
+        with self.assertRaises(BackendNotAvailableError):
+            Container(name='docker')
+
+    def test_existing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            files = [Path(directory, name) for name in ('a', 'b', 'c')]
+            for file in files[:2]:
+                file.touch()
+
+            dangling = Path(directory, 'dangling')
+            dangling.symlink_to(Path(directory, 'nowhere'))
+            link = Path(directory, 'link')
+            link.symlink_to(files[0])
+
+            paths = [
+                *files,
+                dangling,
+                link,
+                Path(directory, 'missing', 'a'),
+                Path(directory, 'missing', 'b'),
+                Path(directory, 'a', '..'),
+                Path(directory),
+            ]
+
+            self.assertSetEqual(_existing(paths),
+                                {path
+                                 for path in paths if path.exists()})
+
+    def test_guess_backend(self):
+        # Both singularity and apptainer use .sif images
+        self.assertIsNone(guess_backend('/tmp/image.sif'))
+        self.assertIsNone(guess_backend('/tmp/image.unknown'))
+
+        with patch.dict('e4s_cl.cf.containers.MIMES', {'.img': ['dummy']}):
+            self.assertEqual(guess_backend('/tmp/image.img'), 'dummy')
+
+    @tests.skipUnless(LINKER_CACHE.exists(), "No linker cache on the system")
+    def test_analysis_cache(self):
+        cache_data = LINKER_CACHE.read_bytes()
+
+        def _analyse(image, options=()):
+            container = Container(name='dummy', image=image)
+            with patch.object(type(container), 'run',
+                              return_value=(0, cache_data)) as run, \
+                    patch.object(Container, '_additional_options',
+                                 return_value=list(options)):
+                container.get_data()
+            self.assertTrue(container.cache)
+            return run.called
+
+        invalidate_analysis_cache()
+        self.assertTrue(_analyse('image.sif'))
+        self.assertFalse(_analyse('image.sif'))
+
+        # Other images and backend options are analysed separately
+        self.assertTrue(_analyse('other.sif'))
+        self.assertTrue(_analyse('image.sif', ['--contain']))
+        self.assertFalse(_analyse('image.sif', ['--contain']))
+
+        invalidate_analysis_cache('other.sif')
+        self.assertFalse(_analyse('image.sif'))
+        self.assertTrue(_analyse('other.sif'))
+
+        invalidate_analysis_cache()
+        self.assertTrue(_analyse('image.sif'))
+        invalidate_analysis_cache()
+
     def test_bind_file(self):
         container = Container(name='dummy')
 
@@ -58,6 +159,13 @@ class ContainerTest(tests.TestCase):
         self.assertIn(BoundFile(target, dest, FileOptions.READ_WRITE),
                       list(container.bound))
 
+    def test_bind_file_normalized(self):
+        container = Container(name='dummy')
+
+        container.bind_file('/tmp', dest='/.e4s-cl//hostlibs/./../tmp/')
+        self.assertSetEqual(set(container._bound_files),
+                            {BoundFile(Path('/tmp'), Path('/.e4s-cl/tmp'))})
+
     def test_bind_file_inclusion(self):
         pmi = BoundFile(Path('/usr/lib/libpmi.so'), Path('/usr/lib/libpmi.so'),
                         FileOptions.READ_ONLY)
@@ -98,6 +206,16 @@ class ContainerTest(tests.TestCase):
 
         self.assertSetEqual({ref, file}, files)
 
+    def test_unrelative(self):
+        self.assertSetEqual(_unrelative('/tmp'), {Path('/tmp')})
+        self.assertSetEqual(_unrelative('/tmp/../proc/meminfo'),
+                            {Path('/tmp'), Path('/proc/meminfo')})
+
+        # Symlinks are bound along with their target
+        library = Path(tests.ASSETS, 'libgver.so.0')
+        self.assertSetEqual(_unrelative(library.as_posix()),
+                            {library, library.resolve()})
+
     def test_double_bind(self):
         container = Container(name='dummy')
 
@@ -110,3 +228,61 @@ class ContainerTest(tests.TestCase):
 
         self.assertSetEqual({bind1}, optimize_bind_addition(bind2, {bind1}))
         self.assertSetEqual({bind2}, optimize_bind_addition(bind1, {bind2}))
+
+    def test_bound_update(self):
+        container = Container(name='dummy')
+        library = Path(tests.ASSETS, 'libgver.so.0')
+
+        container.bind_file(library, library)
+        container.bind_file('/e4s-cl/nonexistent', Path('/nonexistent'))
+        self.assertTupleEqual(container.bound, (BoundFile(library, library), ))
+
+        container.bind_file(tests.ASSETS, tests.ASSETS)
+        self.assertTupleEqual(container.bound,
+                              (BoundFile(tests.ASSETS, tests.ASSETS), ))
+
+    def test_bind_files(self):
+        container = Container(name='dummy')
+        assets = tests.ASSETS.resolve()
+        library = Path(assets, 'libgver.so.0')
+
+        # The library and its target are contained in the directory
+        container.bind_files([library, assets, ''],
+                             option=FileOptions.READ_WRITE)
+        self.assertSetEqual(set(container._bound_files),
+                            {BoundFile(assets, assets, FileOptions.READ_WRITE)})
+
+    def test_bind_index(self):
+        library = Path(tests.ASSETS, 'libgver.so.0')
+        library_symlink = Path(tests.ASSETS, 'libgver.so.0.0.0')
+
+        binds = {
+            BoundFile(Path(origin), Path(destination))
+            for origin, destination in [
+                ('/usr', '/usr'),
+                ('/usr/lib', '/usr/lib'),
+                ('/usr/lib/libmpi.so', '/usr/lib/libmpi.so'),
+                ('/usr/lib/libmpi.so', '/.e4s-cl/hostlibs/libmpi.so'),
+                ('/opt/openmpi/lib', '/usr/openmpi'),
+                ('/opt/openmpi/lib/libmpi.so', '/usr/openmpi/libmpi.so'),
+                ('/opt/openmpi/lib/libmpi.so', '/usr/libmpi.so'),
+                (library, '/hostlibs/libgver.so.0'),
+                (library_symlink, '/hostlibs/libgver.so.0'),
+            ]
+        }
+
+        index = _BindTrie(binds)
+        self.assertEqual(len(index), len(binds))
+        self.assertSetEqual(set(index), binds)
+
+        for new in binds:
+            self.assertIn(new, index)
+            self.assertSetEqual(index.containing(new),
+                                {b for b in binds if _contains(b, new)})
+            self.assertSetEqual(index.contained(new),
+                                {b for b in binds if _contains(new, b)})
+
+        for bind in binds:
+            index.discard(bind)
+            self.assertNotIn(bind, index)
+        self.assertEqual(len(index), 0)
@@ -1,3 +1,4 @@
+import tempfile
 from os import getcwd, environ, pathsep
 from unittest import skipIf
 from pathlib import Path
@@ -52,6 +53,47 @@ class ContainerTestBarebones(tests.TestCase):
         self.assertIn('tmp2',
                       [Path(path).name for path in list_directory_files(Path(BAREBONES_LIBRARY_DIR))])
 
+    def test_bind_files(self):
+        container = Container(name='barebones')
+        library = Path(tests.ASSETS, 'libgver.so.0.0.0')
+
+        container.bind_files([library, '/tmp', ''],
+                             option=FileOptions.READ_WRITE)
+
+        self.assertSetEqual(
+            {path.name for path in Path(BAREBONES_LIBRARY_DIR).iterdir()},
+            {library.name, 'tmp'})
+        self.assertIn(Path(BAREBONES_LIBRARY_DIR, library.name),
+                      container.list_directory_sofiles(
+                          Path(BAREBONES_LIBRARY_DIR)))
+
+    def test_list_directory_sofiles(self):
+        container = Container(name='barebones')
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ['libmpi.so', 'libmpi.so.12', 'libso.a', 'file.sox',
+                         '.so', 'libmpi.so.']:
+                Path(directory, name).touch()
+            Path(directory, 'libpmi.so').symlink_to(Path(directory, 'missing'))
+
+            self.assertSetEqual(
+                set(container.list_directory_sofiles(Path(directory))), {
+                    Path(directory, name)
+                    for name in ['libmpi.so', 'libmpi.so.12', 'libpmi.so']
+                })
+
+    def test_ld_preload(self):
+        container = Container(name='barebones')
+        library = Path(tests.ASSETS, 'libgver.so.0')
+
+        container.bind_file(library)
+        container.bind_file(library)
+        container.bind_file('/e4s-cl/nonexistent/libmissing.so')
+        container._prepare([''])
+
+        self.assertEqual(container.env['LD_PRELOAD'],
+                         str(Path(BAREBONES_LIBRARY_DIR, library.name)))
+
     def test_additional_options_config(self):
         container = Container(name='barebones')
         command = ['']
@@ -0,0 +1,25 @@
+from pathlib import Path
+import tests
+from e4s_cl.cf.containers import Container
+
+
+class ContainerTestContainerless(tests.TestCase):
+
+    def test_setup_import(self):
+        container = Container(name='containerless')
+        library = Path(tests.ASSETS, 'libgver.so.0')
+
+        container.bind_file(library,
+                            Path(container.import_library_dir, library.name))
+        container.bind_file(library, Path('/elsewhere', library.name))
+        container.bind_file(tests.ASSETS,
+                            Path(container.import_dir, tests.ASSETS.name))
+        container._setup_import()
+
+        link = Path(container.import_library_dir, library.name)
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(Path(link.resolve()), library.resolve())
+        self.assertListEqual(list(container.import_dir.iterdir()),
+                             [container.import_library_dir])
+        self.assertTrue(container.env['LD_LIBRARY_PATH'].startswith(
+            container.import_dir.as_posix()))
@@ -10,6 +10,7 @@ from e4s_cl.cf.containers import (
     Container,
     FileOptions,
 )
+from e4s_cl.cf.containers.podman import opened_fds
 
 CONFIG_EXECUTABLE = tests.ASSETS / 'bin' / 'podman-conf'
 DEFAULT_CONFIGURATION = config.CONFIGURATION
@@ -24,6 +25,42 @@ backends:
 
 class ContainerTestPodman(tests.TestCase):
 
+    def test_opened_fds(self):
+        with open('/dev/null', encoding='utf-8') as null:
+            fileno = null.fileno()
+            self.assertTrue({0, 1, 2, fileno} <= opened_fds())
+
+        self.assertNotIn(fileno, opened_fds())
+
+    def test_format_bound(self):
+        container = Container(name='podman')
+        library = Path(tests.ASSETS, 'libgver.so.0')
+
+        container.bind_file(library, Path('/hostlibs', library.name))
+        container.bind_file(tests.ASSETS,
+                            Path('/assets'),
+                            option=FileOptions.READ_WRITE)
+
+        self.assertSetEqual(
+            set(container._format_bound()), {
+                f"--mount=type=bind,src={library.as_posix()},"
+                f"dst=/hostlibs/{library.name},ro=true",
+                f"--mount=type=bind,src={tests.ASSETS.as_posix()},dst=/assets",
+            })
+
+    def test_working_dir(self):
+        cwd = Path(getcwd())
+
+        container = Container(name='podman')
+        self.assertNotIn('--workdir', container._prepare(['']))
+
+        container.bind_file(cwd, Path('/elsewhere'))
+        self.assertNotIn('--workdir', container._prepare(['']))
+
+        container.bind_file(cwd, cwd)
+        self.assertContainsInOrder(['--workdir', cwd.as_posix()],
+                                   container._prepare(['']))
+
     def test_additional_options_config(self):
         container = Container(name='podman')
         command = ['']
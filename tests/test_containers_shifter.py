@@ -1,16 +1,18 @@
+import os
 from os import getenv, getcwd, environ, pathsep
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import skipIf
+from unittest.mock import patch
 from pathlib import Path
 import tests
-from e4s_cl import config
+from e4s_cl import config, PYTHON_VERSION
 from e4s_cl.cf.containers import (
     BackendUnsupported,
     BoundFile,
     Container,
     FileOptions,
 )
-from e4s_cl.cf.containers.shifter import _parse_config
+from e4s_cl.cf.containers.shifter import _copy, _load_config, _parse_config
 
 SAMPLE_CONFIG = """#system (required)
 #
@@ -55,6 +57,36 @@ class ContainerTestShifter(tests.TestCase):
         self.assertSetEqual(set(EXPECTED_CONFIG.values()),
                             set(directives.values()))
 
+    def test_load_config(self):
+        with TemporaryDirectory() as directory:
+            config_file = Path(directory, 'udiRoot.conf')
+            config_file.write_text(SAMPLE_CONFIG)
+
+            directives = _load_config(config_file)
+            self.assertDictEqual(directives, EXPECTED_CONFIG)
+            self.assertIs(_load_config(config_file), directives)
+
+            # A modified file is parsed again
+            config_file.write_text("system=cori\n")
+            os.utime(config_file, (0, 0))
+            self.assertDictEqual(_load_config(config_file), {'system': 'cori'})
+
+        self.assertDictEqual(_load_config(config_file), {})
+
+    def test_linker_path(self):
+        with TemporaryDirectory() as directory:
+            config_file = Path(directory, 'udiRoot.conf')
+            config_file.write_text("""defaultModules=mpich,gpu
+module_mpich_siteEnvPrepend=PATH=/opt/mpich/bin LD_LIBRARY_PATH=/opt/mpich/lib:/opt/pmi/lib
+module_gpu_siteEnvPrepend=LD_LIBRARY_PATH=/opt/cuda/lib64
+""")
+
+            with patch('e4s_cl.cf.containers.shifter._DEFAULT_CONFIG_PATH',
+                       config_file):
+                self.assertTupleEqual(
+                    Container(name='shifter').__class__.linker_path,
+                    ('/opt/mpich/lib', '/opt/pmi/lib', '/opt/cuda/lib64'))
+
     def test_create(self):
         container = Container(name='shifter', image='test')
         self.assertFalse(type(container) == Container)
@@ -123,6 +155,15 @@ class ContainerTestShifter(tests.TestCase):
 
         self.assertSetEqual({ref, file}, files)
 
+    def test_prepare_env(self):
+        container = Container(name='shifter', image='test')
+        container.bind_env_var('MYVAR', 'MYVALUE')
+        container.bind_env_var('UNSET', None)
+
+        command = container._prepare(['env'])
+        self.assertIn('--env=MYVAR=MYVALUE', command)
+        self.assertFalse([arg for arg in command if 'UNSET' in arg])
+
     def test_prepare_import_container_dir(self):
         """
         Assert CONTAINER_DIR imports will trigger the creation of a mock directory
@@ -148,6 +189,67 @@ class ContainerTestShifter(tests.TestCase):
 
         temp.cleanup()
 
+    def test_copy(self):
+        with TemporaryDirectory() as source, TemporaryDirectory() as dest:
+            Path(source, 'lib').mkdir()
+            Path(source, 'lib', 'libmpi.so.12').touch()
+            Path(source, 'lib', 'libmpi.so').symlink_to('libmpi.so.12')
+
+            _copy(Path(source, 'lib'), Path(dest, 'lib'))
+            _copy(Path(source, 'lib', 'libmpi.so'), Path(dest, 'libmpi.so'))
+
+            self.assertTrue(Path(dest, 'lib', 'libmpi.so.12').is_file())
+            # Files are copies, not links to the host files
+            self.assertFalse(
+                Path(dest, 'lib', 'libmpi.so.12').samefile(
+                    Path(source, 'lib', 'libmpi.so.12')))
+            for link in [Path(dest, 'lib', 'libmpi.so'), Path(dest, 'libmpi.so')]:
+                self.assertTrue(link.is_symlink())
+                self.assertEqual(os.readlink(link), 'libmpi.so.12')
+
+    def test_prepare_import_nested(self):
+        container = Container(name='shifter')
+        library = Path(tests.ASSETS, 'libgver.so.0.0.0')
+        imported = Path(container.import_library_dir, 'assets')
+
+        # Bind a file inside a directory bound beforehand
+        container.bind_file(library, Path(imported, 'nested', library.name))
+        container.bind_file(tests.ASSETS, imported)
+
+        with TemporaryDirectory() as directory:
+            container._setup_import(Path(directory))
+
+            rebased = Path(directory, container.import_library_dir.name,
+                           'assets')
+            self.assertTrue(Path(rebased, library.name).exists())
+            self.assertTrue(Path(rebased, 'nested', library.name).exists())
+
+    def test_prepare_import_same_directory(self):
+        container = Container(name='shifter')
+        imported = Path(container.import_library_dir, 'merged')
+
+        with TemporaryDirectory() as first, TemporaryDirectory() as second:
+            Path(first, 'libfirst.so').touch()
+            Path(second, 'libsecond.so').touch()
+
+            # Stage two directories into the same destination
+            container.bind_file(Path(first), imported)
+            container.bind_file(Path(second), imported)
+
+            for version in [PYTHON_VERSION, (3, 7, 0)]:
+                with TemporaryDirectory() as directory, \
+                        patch('e4s_cl.cf.containers.shifter.PYTHON_VERSION',
+                              version):
+                    container._setup_import(Path(directory))
+
+                    rebased = Path(directory,
+                                   container.import_library_dir.name,
+                                   'merged')
+                    self.assertSetEqual(
+                        {path.name
+                         for path in rebased.iterdir()},
+                        {'libfirst.so', 'libsecond.so'})
+
     def test_prepare_import_etc_files(self):
         """
         Assert importing /etc files fails
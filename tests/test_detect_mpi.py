@@ -3,14 +3,16 @@ Tests relating to mpi library version detection
 """
 
 from pathlib import Path
+from unittest.mock import patch
 import tests
 from e4s_cl.model.profile import Profile
 from e4s_cl.cf.libraries import resolve
 from e4s_cl.cf.detect_mpi import (
-    profile_mpi_name, detect_mpi, _get_mpi_library_version, _suffix_name,
+    profile_mpi_name, detect_mpi, filter_mpi_libs, _get_mpi_library_version, _suffix_name,
     _extract_mvapich_version, _extract_intel_mpi_version,
     _extract_mpich_version, _extract_cray_mpich_version,
-    _extract_open_mpi_version, _get_mpi_handle)
+    _extract_open_mpi_version, _get_mpi_handle, _get_mpi_vendor_version,
+    _library_version, MPIIdentifier)
 
 EMPTY_LIB = Path(Path(__file__).parent, 'assets', 'libgver.so.0')
 
@@ -35,6 +37,9 @@ class DetectNameTests(tests.TestCase):
                          'apple')
         self.assertEqual(
             _suffix_name('apple', {'advanced', 'apple', 'apple-4'}), 'apple-5')
+        self.assertEqual(
+            _suffix_name('apple', {'apple', 'apple-4-tree', 'apple-2'}),
+            'apple-3')
 
     def test_version_mvapich2(self):
         output_string = """MVAPICH2 Version      :	2.3.5
@@ -74,6 +79,23 @@ MPI BUILD INFO : Built Tue May 19 13:54:36 2020 (git hash e25eab9) MT-G
 
         self.assertEqual(_extract_open_mpi_version(output_string), '4.1.1')
 
+    def test_vendor_version(self):
+        outputs = {
+            "MPI VERSION    : CRAY MPICH version 7.7.14 (ANL base 3.2)":
+            MPIIdentifier('CRAY MPICH', '7.7.14'),
+            "Open MPI v4.0.1, package: Spectrum MPI Distribution, ident: 4.0.1":
+            MPIIdentifier('Spectrum MPI', '4.0.1'),
+            "Intel(R) MPI Library 2019 Update 6 for Linux* OS":
+            MPIIdentifier('Intel(R) MPI', '2019 Update 6'),
+            "Unknown MPI 1.0": None,
+        }
+
+        for output, identifier in outputs.items():
+            with patch('e4s_cl.cf.detect_mpi._get_mpi_library_version',
+                       return_value=output):
+                self.assertEqual(_get_mpi_vendor_version(EMPTY_LIB),
+                                 identifier)
+
     @tests.skipIf(not resolve('libmpi.so'), "No library to test with")
     def test_extract_handle(self):
         self.assertIsNotNone(_get_mpi_handle(Path(resolve('libmpi.so'))))
@@ -106,6 +128,32 @@ MPI BUILD INFO : Built Tue May 19 13:54:36 2020 (git hash e25eab9) MT-G
             _get_mpi_library_version(
                 Path(Path(__file__).parent, 'assets', 'libgver.so.0')))
 
+    def test_get_mpi_library_version_cached(self):
+        _library_version.cache_clear()
+
+        with patch('e4s_cl.cf.detect_mpi._get_mpi_handle',
+                   return_value=None) as handle:
+            self.assertFalse(_get_mpi_library_version(EMPTY_LIB))
+            self.assertFalse(_get_mpi_library_version(EMPTY_LIB.resolve()))
+            handle.assert_called_once_with(EMPTY_LIB.resolve())
+
+        _library_version.cache_clear()
+
+    def test_filter_mpi_libs(self):
+        libraries = [
+            Path('/usr/lib', name) for name in [
+                'libmpi.so', 'libmpi.so.40', 'libmpich.so.12', 'libmpi_cxx.so',
+                'libmpi.a', 'libc.so.6', 'mpi/libmpi.so'
+            ]
+        ]
+
+        self.assertSetEqual(filter_mpi_libs(libraries), {
+            Path('/usr/lib', name) for name in [
+                'libmpi.so', 'libmpi.so.40', 'libmpich.so.12', 'libmpi_cxx.so',
+                'mpi/libmpi.so'
+            ]
+        })
+
     @tests.skipIf(not resolve('libmpi.so'), "No library to test with")
     def test_detect_mpi(self):
         self.assertTrue(detect_mpi([resolve('libmpi.so')]))
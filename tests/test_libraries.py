@@ -0,0 +1,16 @@
+from pathlib import Path
+import tests
+from e4s_cl.cf.libraries import cache_libraries, cache_libraries_data
+
+LINKER_CACHE = Path('/etc/ld.so.cache')
+
+
+class LibrariesTest(tests.TestCase):
+
+    @tests.skipUnless(LINKER_CACHE.exists(), "No linker cache on the system")
+    def test_cache_libraries_data(self):
+        self.assertDictEqual(cache_libraries_data(LINKER_CACHE.read_bytes()),
+                             cache_libraries(LINKER_CACHE.as_posix()))
+
+    def test_cache_libraries_data_invalid(self):
+        self.assertDictEqual(cache_libraries_data(b'not a linker cache'), {})
@@ -0,0 +1,73 @@
+import tempfile
+import tests
+from e4s_cl.cf.storage.local_file import LocalFileStorage
+
+
+class LocalFileStorageTest(tests.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.prefix = tempfile.TemporaryDirectory()
+        self.storage = LocalFileStorage('test', self.prefix.name)
+
+    def tearDown(self):
+        self.storage.disconnect_database()
+        self.prefix.cleanup()
+
+    def _names(self):
+        return sorted(record['name'] for record in self.storage.search())
+
+    def test_search_cache(self):
+        self.assertEqual(self._names(), [])
+
+        self.storage.insert({'name': 'a', 'value': 0})
+        self.assertEqual(self._names(), ['a'])
+
+        self.storage.update({'name': 'b'}, {'name': 'a'})
+        self.assertEqual(self._names(), ['b'])
+
+        self.storage.upsert({'name': 'c', 'value': 1}, {'name': 'c'})
+        self.assertEqual(self._names(), ['b', 'c'])
+
+        self.storage.upsert({'value': 2}, {'name': 'c'})
+        self.assertEqual(
+            [record['value'] for record in self.storage.search()], [0, 2])
+
+        self.storage.remove({'name': 'b'})
+        self.assertEqual(self._names(), ['c'])
+
+        with self.assertRaises(RuntimeError):
+            with self.storage:
+                self.storage.insert({'name': 'd', 'value': 3})
+                self.assertEqual(self._names(), ['c', 'd'])
+                raise RuntimeError
+
+        self.assertEqual(self._names(), ['c'])
+
+    def test_search_cache_copy(self):
+        self.storage.insert({'name': 'a', 'value': 0})
+        self.storage.search().clear()
+        self.storage.search()[0]['name'] = 'b'
+        self.assertEqual(self._names(), ['a'])
+
+    def test_rollback_tables(self):
+        self.storage.insert({'name': 'a'}, table_name='A')
+        self.storage.insert({'name': 'b'}, table_name='B')
+
+        with self.assertRaises(RuntimeError):
+            with self.storage:
+                self.storage.remove({'name': 'a'}, table_name='A')
+                self.assertEqual(
+                    self.storage.search({'name': 'a'}, table_name='A'), [])
+                self.storage.insert({'name': 'c'}, table_name='C')
+                raise RuntimeError
+
+        self.assertEqual(
+            [record['name'] for record in self.storage.search(table_name='A')],
+            ['a'])
+        self.assertEqual(
+            [record['name'] for record in self.storage.search(table_name='B')],
+            ['b'])
+        self.assertEqual(self.storage.search(table_name='C'), [])
+        self.assertEqual(
+            len(self.storage.search({'name': 'a'}, table_name='A')), 1)
@@ -1,9 +1,18 @@
 import os
+import sys
 import tempfile
+import subprocess
 import tarfile
 from pathlib import Path
 import tests
-from e4s_cl.util import which, path_accessible, safe_tar
+from unittest.mock import patch
+from e4s_cl.util import (
+    which,
+    invalidate_which_cache,
+    path_accessible,
+    run_subprocess,
+    safe_tar,
+)
 
 
 class UtilTest(tests.TestCase):
@@ -14,6 +23,40 @@ class UtilTest(tests.TestCase):
         self.assertTrue(executable.is_absolute())
         return executable.as_posix()
 
+    def test_which_path_change(self):
+        with tempfile.TemporaryDirectory() as bindir:
+            executable = Path(bindir, 'e4s-cl-test-executable')
+
+            with patch.dict(os.environ, {'PATH': bindir}):
+                self.assertIsNone(which(executable.name))
+
+                executable.touch()
+                executable.chmod(0o755)
+                self.assertIsNone(which(executable.name))
+
+                invalidate_which_cache()
+                self.assertEqual(which(executable.name), executable.as_posix())
+
+            self.assertIsNone(which(executable.name))
+
+    def test_run_subprocess_capture(self):
+        self.assertEqual(
+            run_subprocess(['sh', '-c', 'printf "\\000e4s"'],
+                           capture_output=True), (0, b'\0e4s'))
+
+        code, output = run_subprocess(['sh', '-c', 'echo e4s; exit 3'],
+                                      capture_output=True)
+        self.assertEqual(code, 3)
+        self.assertEqual(output, b'e4s\n')
+
+    @tests.skipUnless(getattr(subprocess, '_USE_POSIX_SPAWN', False),
+                      "posix_spawn is not used by subprocess")
+    def test_run_subprocess_posix_spawn(self):
+        with patch('sys.stdout', sys.__stdout__), \
+                patch('os.posix_spawn', wraps=os.posix_spawn) as spawn:
+            self.assertEqual(run_subprocess([which('true')]), 0)
+            spawn.assert_called_once()
+
     @tests.skipIf("CICD" in os.environ, "gitlab testing environment")
     def test_access(self):
         self.assertTrue(path_accessible('/tmp', 'r'))